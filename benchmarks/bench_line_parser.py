@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Product Line Parser Benchmark
+Lines per second of the token-by-token parse_product_line_reference versus
+classify_product_line, the single-pass tokenizer (one rsplit of the trailing
+numeric columns into a ProductLine record), on a synthetic pdftotext-style
+corpus (product rows mixed with headers, footers and blank lines).
+
+Usage: python benchmarks/bench_line_parser.py [lines]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import core_pure_python as core
+
+STEMS = ['Montair', 'Moxquin', 'Napa', 'Seclo', 'Maxpro', 'Fexo', 'Rolac', 'Alatrol', 'Ceevit',
+         'Losectil', 'Bizoran', 'Tofen', 'Cef-3', 'Azithrocin', 'Monas', 'Xinc', 'Esoral']
+NOISE_LINES = [
+    "Territory Wise Sale (Group: ALL) From : 01-JAN-24 To : 31-JAN-24",
+    "Terr Id: D12    Printed On: 05-FEB-24 10:31:07 AM",
+    "Code Brand Name         Tgt Qty   Sold Qty   Int Qty   Tgt Val   Sold Val   Int Val   Total",
+    "Group: CARDIO",
+    "Total :      1200     840     12     98000.00     70210.50     900.00     71110.50",
+    "Page 3 of 41",
+    "",
+    "    ",
+]
+
+def make_line(rng):
+    if rng.random() < 0.15:
+        return rng.choice(NOISE_LINES)
+    name = f"{rng.choice(STEMS)} {rng.choice([5, 10, 20, 40, 120, 500])}"
+    if rng.random() < 0.3:
+        name += rng.choice([' Tab', ' Syrup', ' 100ml', ' DS'])
+    sold = rng.choice([0, 0, 4, 25, 130])
+    int_qty = rng.choice([0, 0, 2])
+    sold_val = sold * 7.25
+    int_val = int_qty * 7.25
+    total = sold_val + int_val + rng.choice([0.0, 0.0, 0.0, 3.5])
+    numbers = [rng.randint(0, 400), sold, int_qty, rng.uniform(0, 9000), sold_val, int_val, total]
+    numbers = numbers[:rng.choice([7, 7, 7, 7, 6, 3])]
+    padding = ' ' * rng.randint(1, 6)
+    return (f"{rng.randint(10, 9999):04d}{padding}{name}" +
+            ''.join(f"{' ' * rng.randint(2, 8)}{value:.2f}" if isinstance(value, float)
+                    else f"{' ' * rng.randint(2, 8)}{value}" for value in numbers))
+
+def lines_per_second(parse, lines):
+    start = time.perf_counter()
+    for line in lines:
+        parse(line)
+    return len(lines) / (time.perf_counter() - start)
+
+def main():
+    try:
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    except ValueError:
+        print(__doc__.strip().splitlines()[-1])
+        return 1
+    rng = random.Random(5)
+    lines = [make_line(rng) for _ in range(count)]
+    print(f"📄 {count} lines")
+
+    reference = lines_per_second(core.parse_product_line_reference, lines)
+    classifier = lines_per_second(core.classify_product_line, lines)
+    as_dicts = lines_per_second(core.parse_product_line_python, lines)
+    print(f"reference (split + float loop)   {reference:12,.0f} lines/s")
+    print(f"classify_product_line (records)  {classifier:12,.0f} lines/s  ({classifier / reference:.2f}x)")
+    print(f"parse_product_line_python (dict) {as_dicts:12,.0f} lines/s  ({as_dicts / reference:.2f}x)")
+
+    mismatches = sum(core.parse_product_line_python(line) != core.parse_product_line_reference(line)
+                     for line in lines[:100_000])
+    print(f"{'✅' if not mismatches else '❌'} same results as the reference: {mismatches} mismatch(es)")
+    return 0 if not mismatches else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
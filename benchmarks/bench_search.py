@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Product Search Benchmark
+Per-query time of the linear search_products_python scan versus SearchIndex,
+on a catalogue of many territories loaded together.
+
+Usage: python benchmarks/bench_search.py [territories] [products_per_territory]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import calculator_pure_python
+from search_index import SearchIndex
+from product_table import ProductTable
+
+STEMS = ['montair', 'moxquin', 'napa', 'seclo', 'maxpro', 'fexo', 'rolac', 'alatrol', 'ceevit',
+         'losectil', 'bizoran', 'tofen', 'cef-3', 'azithrocin', 'monas', 'xinc', 'esoral', 'rivotril']
+QUERIES = ['montair', 'mox', 'na', 'seclo 20', 'fexo 120', 'zzz', 'ra', 'cef-3 200']
+
+def make_products(territories, per_territory, rng):
+    products = []
+    for territory in range(territories):
+        for i in range(per_territory):
+            name = f"{rng.choice(STEMS).title()} {rng.choice([5, 10, 20, 40, 120, 200, 500])}"
+            if rng.random() < 0.3:
+                name += rng.choice([' Tab', ' Syrup', ' Inj', ' Plus', ' DS'])
+            sold = rng.choice([0, 0, 4, 25])
+            products.append({
+                'code': f"{i:04d}", 'brand_name': name,
+                'tgt_qty': rng.randint(0, 300), 'sold_qty': sold, 'int_qty': 0,
+                'tgt_val': rng.uniform(0, 9000), 'sold_val': sold * 7.5, 'int_val': 0.0,
+                'total_val': sold * 7.5, 'territory': f"T{territory:03d}",
+            })
+    return products
+
+def per_query_ms(search, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            search(query)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(QUERIES))
+
+def main():
+    territories = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    per_territory = int(sys.argv[2]) if len(sys.argv) > 2 else 250
+    products = make_products(territories, per_territory, random.Random(11))
+    table = ProductTable.from_dicts(products)
+    print(f"📦 {len(products)} products ({territories} territories)")
+
+    start = time.perf_counter()
+    index = SearchIndex(table)
+    print(f"🗂️  index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    linear_ms = per_query_ms(lambda q: calculator_pure_python.search_products_python(products, q), 3)
+    index_rows_ms = per_query_ms(index.matching_rows, 20)
+    index_ms = per_query_ms(index.search, 20)
+    print(f"linear scan       {linear_ms:9.3f} ms/query")
+    print(f"index (rows)      {index_rows_ms:9.3f} ms/query")
+    print(f"index (products)  {index_ms:9.3f} ms/query")
+
+    identical = all(
+        [list(part) for part in index.search(q)] == list(calculator_pure_python.search_products_python(products, q))
+        for q in QUERIES)
+    print(f"{'✅' if identical else '❌'} same results as the linear scan: {identical}")
+    return 0 if identical else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Table Parsing Benchmark
+Rows/second of the vectorised table parser (all pages in one pass, and page
+by page - forced, and through process_tables_fixed, which falls back to the
+row-wise parser below VECTORISE_MIN_ROWS) versus the row-wise
+process_table_rowwise, on synthetic tables
+shaped like Tabula's output, plus the peak memory of the streaming
+page -> row -> product pipeline against parsing the whole range at once.
+
+Usage: python benchmarks/bench_table_parsing.py [pages] [rows_per_page]
+"""
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+import tabula_parser
+from product_table import ProductTable
+
+NAMES = ['Napa Extra', 'Seclo', 'Maxpro', 'Ceevit', 'Fexo', 'Rolac', 'Alatrol', 'Losectil']
+
+def make_page_table(rows_per_page, rng):
+    """One page as Tabula returns it: a header row, product rows, blanks and group lines"""
+    rows = [['Code Brand Name', 'Tgt Qty Sold Qty', 'Int Qty', 'Tgt Value', 'Sold Value', 'Int Value', 'Total Value']]
+    for i in range(rows_per_page):
+        if rng.random() < 0.05:
+            rows.append([np.nan] * 7)
+            continue
+        if rng.random() < 0.03:
+            rows.append([f"Group: {rng.choice(['CARDIO', 'GASTRO', 'ORTHO'])}", np.nan, np.nan, np.nan, np.nan, np.nan, np.nan])
+            continue
+        code = f"{rng.choice('ABCDEFGHKLMNPRSTVZ')}{rng.choice('ABCDEFGHKLMNPRSTVZ')}{rng.randint(1, 99)}"
+        tgt, sold, extra = rng.randint(0, 500), rng.randint(0, 500), rng.randint(0, 20)
+        price = rng.choice([2.5, 5.0, 12.0, 30.0, 150.0])
+        sold_value = f"{sold * price:.2f}" if sold else np.nan
+        int_value = f"{extra * price:.2f}" if extra else np.nan
+        rows.append([f"{code} {rng.choice(NAMES)} {rng.randint(5, 500)}mg", f"{tgt} {sold}", extra,
+                     f"{tgt * price:.2f}", sold_value, int_value, f"{(sold + extra) * price:.2f}"])
+    return pd.DataFrame(rows)
+
+def peak_memory(run):
+    """(result, peak bytes allocated while run() executes)"""
+    tracemalloc.start()
+    try:
+        result = run()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def whole_range(tables):
+    return ProductTable.from_dataframe(tabula_parser.create_final_dataframe(tabula_parser.process_tables_fixed(tables)))
+
+def streamed(tables):
+    page_tables = ([table] for table in tables)
+    return ProductTable.concat(list(tabula_parser.iter_products(tabula_parser.iter_table_rows(page_tables))))
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    rows_per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 45
+    rng = random.Random(42)
+    tables = [make_page_table(rows_per_page, rng) for _ in range(pages)]
+    input_rows = sum(len(table) for table in tables)
+    print(f"📄 {pages} pages, {input_rows} table rows")
+
+    results = {}
+    for name, parse in (('row-wise', lambda: [row for table in tables
+                                              for row in tabula_parser.process_table_rowwise(table)]),
+                        ('per-page', lambda: pd.concat([tabula_parser.process_table_fixed(table)
+                                                        for table in tables], ignore_index=True)),
+                        ('per-page auto', lambda: pd.concat([tabula_parser.process_tables_fixed([table])
+                                                             for table in tables], ignore_index=True)),
+                        ('vectorised', lambda: tabula_parser.process_tables_fixed(tables))):
+        start = time.perf_counter()
+        rows = parse()
+        elapsed = time.perf_counter() - start
+        results[name] = (rows, elapsed)
+        print(f"{name:<14} {len(rows):>8} products  {elapsed:8.3f}s  {input_rows / elapsed:>12,.0f} rows/s")
+
+    # Same products either way
+    reference = tabula_parser.create_final_dataframe(results['row-wise'][0])
+    vectorised = tabula_parser.create_final_dataframe(results['vectorised'][0])
+    identical = reference.values.tolist() == vectorised.values.tolist()
+    print(f"{'✅' if identical else '❌'} outputs identical: {identical}")
+    print(f"⚡ speed-up: {results['row-wise'][1] / results['vectorised'][1]:.1f}x")
+
+    # Streaming pipeline: same products, one page of intermediate frames at a time
+    for name, run in (('whole range', lambda: whole_range(tables)), ('streamed', lambda: streamed(tables))):
+        start = time.perf_counter()
+        run()
+        print(f"{name:<12} {time.perf_counter() - start:8.3f}s", end='')
+        products, peak = peak_memory(run)
+        print(f"  peak {peak / 1e6:8.1f} MB")
+        results[name] = products
+    batch_products, stream_products = results['whole range'], results['streamed']
+    same_stream = batch_products.to_dicts() == stream_products.to_dicts()
+    print(f"{'✅' if same_stream else '❌'} streamed products identical: {same_stream}")
+    return 0 if identical and same_stream else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Calculator Backend Parity Check
+Runs every available calculator backend (Cython, NumPy, pure Python) against
+the pure-Python reference, on both a list of product dicts and a ProductTable.
+
+Strings and the national average are compared exactly. Other numbers are
+compared with a 1e-6 relative tolerance: NumPy sums columns pairwise and the
+compiled backend accumulates in C, so totals over float values can differ from
+Python's left-to-right sum() in the last bits (e.g. 1.5e-08 on a 10-million
+Taka target total) without any real difference in the report.
+
+Usage: python benchmarks/check_backend_parity.py
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import calculator
+from product_table import ProductTable
+
+RELATIVE_TOLERANCE = 1e-6
+QUERIES = ("mon", "NAPA", "20", "zzz", "")
+
+def same_number(a, b):
+    return abs(a - b) <= RELATIVE_TOLERANCE * max(1.0, abs(a), abs(b))
+
+def same_products(expected, actual):
+    """Same products in the same order (numbers compared with the relative tolerance)"""
+    expected, actual = list(expected), list(actual)
+    if len(expected) != len(actual):
+        return False
+    for left, right in zip(expected, actual):
+        if left.keys() != right.keys():
+            return False
+        for key, value in left.items():
+            other = right[key]
+            if isinstance(value, str) or isinstance(other, str):
+                if value != other:
+                    return False
+            elif not same_number(value, other):
+                return False
+    return True
+
+def sample_products(count=500, seed=7):
+    """Deterministic product dicts with active, zero-activity and inconsistent rows"""
+    rng = random.Random(seed)
+    names = ["Montair 10", "Moxquin 400", "Napa Extra", "Seclo 20", "Maxpro 40", "Fexo 120", "Rolac 10"]
+    products = []
+    for i in range(count):
+        sold_qty = rng.choice([0, 0, 0, 3, 12, 150])
+        int_qty = rng.choice([0, 0, 2])
+        sold_val = round(sold_qty * rng.choice([2.5, 8.0, 31.75]), 2)
+        int_val = round(int_qty * 8.0, 2)
+        total_val = sold_val + int_val + rng.choice([0.0, 0.0, 0.0, 0.5])
+        products.append({
+            'code': f"{chr(65 + i % 26)}{i % 100:02d}",
+            'brand_name': rng.choice(names),
+            'tgt_qty': rng.randint(0, 400),
+            'sold_qty': sold_qty,
+            'int_qty': int_qty,
+            'tgt_val': round(rng.uniform(0, 50000), 2),
+            'sold_val': sold_val,
+            'int_val': int_val,
+            'total_val': total_val,
+            'territory': 'D12',
+        })
+    return products
+
+def check_backend_parity(product_data=None, queries=QUERIES):
+    """List of mismatch descriptions (empty when all backends agree with the reference)"""
+    products = list(product_data) if product_data is not None else sample_products()
+    reference = calculator.load_backend("python")
+    mismatches = []
+
+    for name in calculator.available_backends():
+        backend = calculator.load_backend(name)
+        for kind, data in (("list", products), ("table", ProductTable.from_dicts(products))):
+            label = f"{name}/{kind}"
+
+            expected = reference.calculate_totals(products)
+            actual = backend.calculate_totals(data)
+            if expected.keys() != actual.keys() or not all(same_number(expected[k], actual[k]) for k in expected):
+                mismatches.append(f"{label}: calculate_totals")
+
+            for total, share in ((expected['total_accounted_val'], 0.0123), (0.0, 0.5), (1234567.0, 0.0)):
+                if reference.calculate_national_average(total, share) != backend.calculate_national_average(total, share):
+                    mismatches.append(f"{label}: calculate_national_average({total}, {share})")
+
+            for left, right in zip(reference.filter_products_by_activity(products),
+                                   backend.filter_products_by_activity(data)):
+                if not same_products(left, right):
+                    mismatches.append(f"{label}: filter_products_by_activity")
+
+            for query in queries:
+                for left, right in zip(reference.search_products(products, query),
+                                       backend.search_products(data, query)):
+                    if not same_products(left, right):
+                        mismatches.append(f"{label}: search_products({query!r})")
+
+            if not same_products(reference.verify_data_consistency(products),
+                                 backend.verify_data_consistency(data)):
+                mismatches.append(f"{label}: verify_data_consistency")
+
+    return mismatches
+
+def main():
+    print(f"Calculator backend: {calculator.BACKEND_NAME} "
+          f"(available: {', '.join(calculator.available_backends())})")
+    problems = check_backend_parity()
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print("✅ All backends match the pure-Python reference")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Import-Time Budget Check
+Imports ipl_analyzer under `python -X importtime` and fails when startup
+pulls in a heavy dependency or exceeds the time budget, so `report -h` /
+`report -v` stay instant.
+
+Usage: python benchmarks/check_import_time.py [budget_ms]
+"""
+
+import os
+import sys
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+DEFAULT_BUDGET_MS = 250
+# Must only be imported once extraction/search actually runs
+HEAVY_MODULES = ('pandas', 'numpy', 'tabula', 'jpype', 'tabula_parser', 'product_table',
+                 'calculator', 'result_cache', 'search_index', 'batch_mode')
+
+def parse_importtime(stderr):
+    """{module: cumulative microseconds} from -X importtime output"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        name = module.strip()
+        timings.setdefault(name, int(cumulative))
+    return timings
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ipl_analyzer'],
+                            cwd=SRC_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"❌ import ipl_analyzer failed:\n{result.stderr[-2000:]}")
+        return 1
+
+    timings = parse_importtime(result.stderr)
+    total_ms = timings.get('ipl_analyzer', 0) / 1000
+    heavy = sorted({name.split('.')[0] for name in timings} & set(HEAVY_MODULES))
+
+    print(f"⏱️  import ipl_analyzer: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    slowest = sorted(((us, name) for name, us in timings.items() if '.' not in name and name != 'ipl_analyzer'),
+                     reverse=True)[:5]
+    for us, name in slowest:
+        print(f"   {name:<24} {us / 1000:7.1f} ms")
+
+    failed = False
+    if heavy:
+        print(f"❌ heavy modules imported at startup: {', '.join(heavy)}")
+        failed = True
+    if total_ms > budget_ms:
+        print(f"❌ over budget by {total_ms - budget_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("✅ startup import time within budget")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Benchmark Suite
+Generates a synthetic "Territory Wise Sale" PDF locally (no files from the
+phone needed), times every pipeline stage on it and appends the results to a
+JSON history, so runs can be compared between commits.
+
+Stages that need an external tool (pdftk, pdftotext, Java for Tabula) are
+reported as skipped when the tool is missing; the parsing, conversion, search
+and totals stages always run, on the report's pdftotext-style text and
+Tabula-style tables.
+
+Usage: python benchmarks/run_benchmarks.py [--territories N] [--products N]
+           [--rows-per-page N] [--repeat N] [--history PATH | --no-history] [--keep-pdf]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..', 'src'))
+
+import file_hashing
+import territory_index
+import core_pure_python as core
+import text_engine
+import tabula_parser
+import calculator
+from product_table import ProductTable
+from search_index import SearchIndex
+from synthetic_report import SyntheticReport, ROWS_PER_PAGE, write_pdf
+
+DEFAULT_HISTORY = os.path.join(BENCHMARKS_DIR, 'benchmark_history.json')
+QUERIES = ['montair', 'mox', 'na', 'seclo 20', 'fexo 120', 'cap', 'zzz', 'ceevt', 'rivotrl 5']
+
+def measure(run, repeat):
+    """(best wall time in seconds over repeat runs, result of the last run)"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def git_commit():
+    """Short HEAD commit, with -dirty when tracked files are modified; None outside git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=BENCHMARKS_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except Exception:
+        return None
+
+def load_history(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def save_history(path, history):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=1)
+
+# Stages
+def cut_pages(pdf_path, report, output_dir):
+    """pdftk cat per territory, like the original page-cutting step"""
+    for territory in report.territories:
+        subprocess.run(['pdftk', pdf_path, 'cat', f"{territory['first_page']}-{territory['last_page']}",
+                        'output', os.path.join(output_dir, f"{territory['territory']}.pdf")],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def parse_lines(page_texts):
+    classify = core.classify_product_line
+    return [product for text in page_texts for line in text.splitlines() if (product := classify(line))]
+
+def parse_tables(report, page_tables):
+    """{territory: [row DataFrames]} through the streaming row stage"""
+    return {
+        territory['territory']: list(tabula_parser.iter_table_rows(
+            page_tables[page - 1] for page in range(territory['first_page'], territory['last_page'] + 1)))
+        for territory in report.territories
+    }
+
+def convert_products(row_frames):
+    return {
+        territory: ProductTable.concat(list(tabula_parser.iter_products(iter(frames), territory)))
+        for territory, frames in row_frames.items()
+    }
+
+def run_queries(index):
+    results = 0
+    for query in QUERIES:
+        matches, zero_matches = index.search(query)
+        results += len(matches) + len(zero_matches)
+        if not len(matches) and not len(zero_matches):
+            results += len(index.suggest(query))
+    return results
+
+def run_totals(backend, tables):
+    return [(backend.calculate_totals(table), backend.filter_products_by_activity(table)) for table in tables]
+
+def run_suite(report, pdf_path, repeat, work_dir):
+    """{stage: seconds or None when skipped}, [problems]"""
+    results = {}
+    problems = []
+
+    def stage(name, run, times=repeat):
+        seconds, value = measure(run, times)
+        results[name] = seconds
+        print(f"  {name:<22} {seconds * 1000:>10.1f} ms")
+        return value
+
+    def skip(name, reason):
+        results[name] = None
+        print(f"  {name:<22} {'skipped':>10}    ({reason})")
+
+    stage('pdf.generate', lambda: write_pdf(report, pdf_path), 1)
+    stage('pdf.hash', lambda: file_hashing.hash_file(pdf_path))
+
+    if shutil.which('pdftk'):
+        cut_dir = os.path.join(work_dir, 'cut')
+        os.makedirs(cut_dir, exist_ok=True)
+        stage('pdf.page_cut', lambda: cut_pages(pdf_path, report, cut_dir))
+    else:
+        skip('pdf.page_cut', "pdftk not found")
+
+    page_texts = [report.page_text(page) for page in range(1, report.page_count + 1)]
+    if territory_index.is_available():
+        extracted = stage('pdf.text', lambda: [text for _, text in territory_index.iter_pdf_pages_text(pdf_path)])
+        if len(extracted) == report.page_count:
+            page_texts = extracted
+        else:
+            problems.append(f"pdftotext returned {len(extracted)} pages, expected {report.page_count}")
+        entries = stage('territory.index', lambda: territory_index.build_territory_index(pdf_path))
+        expected = [(t['territory'], t['first_page'], t['last_page']) for t in report.territories]
+        if [(e['territory'], e['first_page'], e['last_page']) for e in entries] != expected:
+            problems.append("territory index does not match the generated territories")
+    else:
+        skip('pdf.text', "pdftotext not found")
+        skip('territory.index', "pdftotext not found")
+
+    headers = stage('header.text', lambda: [text_engine.parse_header_text(page_texts[t['first_page'] - 1], pdf_path)
+                                            for t in report.territories])
+    if [header['territory_id'] for header in headers] != [t['territory'] for t in report.territories]:
+        problems.append("text headers do not name the generated territories")
+
+    session = tabula_parser.TabulaSession()
+    if session.page_count(pdf_path) is not None:
+        stage('header.tabula', lambda: [tabula_parser.extract_header_info(pdf_path, session, t['first_page'])
+                                        for t in report.territories])
+        stage('tables.tabula', lambda: sum(len(tables) for tables in tabula_parser.iter_page_tables(
+            pdf_path, (1, report.page_count), session)))
+        session.close()
+    else:
+        skip('header.tabula', "Tabula/Java not available")
+        skip('tables.tabula', "Tabula/Java not available")
+
+    lines = stage('parse.lines', lambda: parse_lines(page_texts))
+    if len(lines) != report.product_count:
+        problems.append(f"line parser found {len(lines)} products, expected {report.product_count}")
+
+    # Tabula-shaped tables are built up front so only the parser is timed
+    page_tables = [report.page_tables(page) for page in range(1, report.page_count + 1)]
+    row_frames = stage('parse.tables', lambda: parse_tables(report, page_tables))
+    products = stage('convert.products', lambda: convert_products(row_frames))
+    for territory in report.territories:
+        table = products[territory['territory']]
+        expected_total = round(sum(product['total_val'] for product in territory['products']), 2)
+        if len(table) != len(territory['products']) or round(float(table.total_val.sum()), 2) != expected_total:
+            problems.append(f"{territory['territory']}: converted products do not match the generated ones")
+
+    tables = list(products.values())
+    index = stage('search.index', lambda: SearchIndex(ProductTable.concat(tables)))
+    stage('search.queries', lambda: run_queries(index))
+
+    for name in calculator.available_backends():
+        stage(f"totals.{name}", lambda: run_totals(calculator.load_backend(name), tables))
+
+    return results, problems
+
+def compare_with_previous(history, record):
+    """Print the change against the last run with the same report size"""
+    previous = next((entry for entry in reversed(history) if entry.get('config') == record['config']), None)
+    if not previous:
+        return
+    print(f"\n📊 Compared with {previous.get('commit') or 'unknown commit'} ({previous.get('recorded_at')}):")
+    for name, seconds in record['results'].items():
+        before = previous['results'].get(name)
+        if seconds is None or not before:
+            continue
+        change = 100 * (seconds - before) / before
+        marker = '🔺' if change > 10 else ('🔻' if change < -10 else '  ')
+        print(f"  {marker} {name:<22} {before * 1000:>10.1f} -> {seconds * 1000:>10.1f} ms  ({change:+.0f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every pipeline stage on a synthetic sales report")
+    parser.add_argument('--territories', type=int, default=6)
+    parser.add_argument('--products', type=int, default=400, help="products per territory")
+    parser.add_argument('--rows-per-page', type=int, default=ROWS_PER_PAGE)
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage (the best is kept)")
+    parser.add_argument('--seed', type=int, default=25)
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSON history file to append to")
+    parser.add_argument('--no-history', action='store_true', help="don't record this run")
+    parser.add_argument('--keep-pdf', action='store_true', help="keep the generated PDF")
+    args = parser.parse_args()
+
+    report = SyntheticReport(args.territories, args.products, args.rows_per_page, args.seed)
+    work_dir = tempfile.mkdtemp(prefix='ipl_bench_')
+    pdf_path = os.path.join(work_dir, 'mpo_sale_qty_value_SYNTHETIC.PDF')
+    print(f"📄 Synthetic report: {report.page_count} pages, {len(report.territories)} territories, "
+          f"{report.product_count} products (best of {args.repeat})")
+
+    try:
+        results, problems = run_suite(report, pdf_path, args.repeat, work_dir)
+    finally:
+        if args.keep_pdf:
+            print(f"📁 PDF kept: {pdf_path}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print("✅ Every stage returned the generated products")
+
+    record = {
+        'commit': git_commit(),
+        'recorded_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'calculator_backend': calculator.BACKEND_NAME,
+        'config': {'territories': args.territories, 'products': args.products,
+                   'rows_per_page': args.rows_per_page, 'seed': args.seed},
+        'repeat': args.repeat,
+        'pages': report.page_count,
+        'results': results,
+        'ok': not problems,
+    }
+
+    if not args.no_history:
+        history = load_history(args.history)
+        compare_with_previous(history, record)
+        history.append(record)
+        save_history(args.history, history)
+        print(f"💾 Recorded in {args.history}")
+
+    return 0 if not problems else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
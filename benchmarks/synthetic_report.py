@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Synthetic "Territory Wise Sale" Reports
+Builds a report of any size (territories x products per territory) with
+known contents, and renders it three ways:
+  - write_pdf(): a real multi-page PDF (hand-written PDF 1.4, Courier text),
+    laid out like the sales report so pdftotext/pdftk/Tabula can read it
+  - page_text(): the page as pdftotext -layout prints it
+  - page_tables(): the page's table area as Tabula returns it
+
+Usage: python benchmarks/synthetic_report.py output.pdf [territories] [products_per_territory]
+"""
+
+import sys
+import math
+import random
+
+STEMS = ['Montair', 'Moxquin', 'Napa', 'Seclo', 'Maxpro', 'Fexo', 'Rolac', 'Alatrol', 'Ceevit',
+         'Losectil', 'Bizoran', 'Tofen', 'Azithrocin', 'Monas', 'Xinc', 'Esoral', 'Rivotril', 'Filmet']
+FORMS = ['', ' Tab', ' Cap', ' Syrup', ' DS', ' Plus']
+GROUPS = ['CARDIO', 'GASTRO', 'ORTHO', 'RESPI', 'NEURO']
+PERIOD = ('01-JAN-24', '31-JAN-24')
+PRINTED_ON = '05-FEB-24 10:31:07 AM'
+
+# Page geometry (points): A4, 8 pt Courier, rows inside Tabula's table area (top 100-800)
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+FONT_SIZE = 8
+LEFT_MARGIN = 20
+HEADER_TOPS = (40, 55, 70)
+TABLE_TOP = 105
+ROW_HEIGHT = 14
+FOOTER_TOP = 820
+ROWS_PER_PAGE = 45
+
+COLUMN_HEADER = ("Code Brand Name                  Tgt Qty   Sold Qty   Int Qty    Tgt Value   "
+                 "Sold Value    Int Value  Total Value")
+
+class SyntheticReport:
+    """
+    Territories with their products, split into pages.
+    territories: [{'territory', 'group', 'first_page', 'last_page', 'products'}]
+    pages: [(territory, [product, ...])] - one entry per page, in page order
+    """
+
+    def __init__(self, territories=4, products_per_territory=120, rows_per_page=ROWS_PER_PAGE, seed=25):
+        rng = random.Random(seed)
+        self.rows_per_page = rows_per_page
+        self.territories = []
+        self.pages = []
+
+        for t in range(territories):
+            territory = {
+                'territory': f"D{t + 10:02d}",
+                'group': GROUPS[t % len(GROUPS)],
+                'products': [make_product(i, rng) for i in range(products_per_territory)],
+            }
+            page_count = max(1, math.ceil(products_per_territory / rows_per_page))
+            territory['first_page'] = len(self.pages) + 1
+            territory['last_page'] = len(self.pages) + page_count
+            for p in range(page_count):
+                self.pages.append((territory, territory['products'][p * rows_per_page:(p + 1) * rows_per_page]))
+            self.territories.append(territory)
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+    @property
+    def product_count(self):
+        return sum(len(territory['products']) for territory in self.territories)
+
+    def page_lines(self, page_number):
+        """[(top, text)] drawn on a 1-based page"""
+        territory, products = self.pages[page_number - 1]
+        lines = []
+        if page_number == territory['first_page']:
+            lines += [
+                (HEADER_TOPS[0], f"Territory Wise Sale (Group: {territory['group']})     "
+                                 f"From : {PERIOD[0]} To {PERIOD[1]}"),
+                (HEADER_TOPS[1], f"Printed On: {PRINTED_ON}"),
+                (HEADER_TOPS[2], f"Group: {territory['group']}   Terr Id: {territory['territory']}"),
+            ]
+        lines.append((TABLE_TOP, COLUMN_HEADER))
+        for row, product in enumerate(products, 1):
+            lines.append((TABLE_TOP + row * ROW_HEIGHT, format_row(product)))
+        lines.append((FOOTER_TOP, f"Page {page_number} of {self.page_count}"))
+        return lines
+
+    def page_text(self, page_number):
+        """The page as pdftotext -layout prints it"""
+        return "\n".join(text for _, text in self.page_lines(page_number)) + "\n"
+
+    def page_tables(self, page_number):
+        """The table area of a page as Tabula returns it: [DataFrame] with a header row"""
+        import pandas as pd
+
+        _, products = self.pages[page_number - 1]
+        rows = [['Code Brand Name', 'Tgt Qty Sold Qty', 'Int Qty', 'Tgt Value', 'Sold Value', 'Int Value', 'Total Value']]
+        for product in products:
+            rows.append([f"{product['code']} {product['brand_name']}",
+                         f"{product['tgt_qty']} {product['sold_qty']}", str(product['int_qty']),
+                         f"{product['tgt_val']:.2f}", f"{product['sold_val']:.2f}",
+                         f"{product['int_val']:.2f}", f"{product['total_val']:.2f}"])
+        return [pd.DataFrame(rows)]
+
+def make_product(index, rng):
+    """One product row; values are exact to two decimals so every parser reads the same numbers"""
+    sold_qty = rng.choice([0, 0, 0, 4, 12, 25, 130])
+    int_qty = rng.choice([0, 0, 0, 2, 6])
+    price = rng.choice([2.5, 4.25, 8.0, 12.5, 31.75, 150.0])
+    tgt_qty = rng.randint(0, 500)
+    return {
+        'code': f"{chr(65 + index // 260 % 26)}{chr(65 + index // 10 % 26)}{index % 10}",
+        'brand_name': f"{rng.choice(STEMS)} {rng.choice([5, 10, 20, 40, 120, 500])}{rng.choice(FORMS)}",
+        'tgt_qty': tgt_qty,
+        'sold_qty': sold_qty,
+        'int_qty': int_qty,
+        'tgt_val': round(tgt_qty * price, 2),
+        'sold_val': round(sold_qty * price, 2),
+        'int_val': round(int_qty * price, 2),
+        'total_val': round((sold_qty + int_qty) * price, 2),
+    }
+
+def format_row(product):
+    return (f"{product['code']:<4} {product['brand_name']:<26} {product['tgt_qty']:>8} {product['sold_qty']:>10} "
+            f"{product['int_qty']:>9} {product['tgt_val']:>12.2f} {product['sold_val']:>12.2f} "
+            f"{product['int_val']:>12.2f} {product['total_val']:>12.2f}")
+
+def _pdf_string(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def write_pdf(report, path):
+    """
+    Write the report as a PDF, one page at a time.
+    Object layout: 1 catalog, 2 page tree, 3 font, then a page and its content stream per page.
+    """
+    page_objects = [4 + 2 * i for i in range(report.page_count)]
+    offsets = []
+
+    with open(path, 'wb') as f:
+        def add_object(body):
+            offsets.append(f.tell())
+            f.write(f"{len(offsets)} 0 obj\n".encode('ascii') + body + b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        add_object(b"<< /Type /Catalog /Pages 2 0 R >>")
+        kids = ' '.join(f"{number} 0 R" for number in page_objects)
+        add_object(f"<< /Type /Pages /Kids [{kids}] /Count {report.page_count} >>".encode('ascii'))
+        add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>")
+
+        for page_number, page_object in enumerate(page_objects, 1):
+            add_object(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_object + 1} 0 R >>".encode('ascii'))
+            content = "".join(
+                f"BT /F1 {FONT_SIZE} Tf {LEFT_MARGIN} {PAGE_HEIGHT - top} Td ({_pdf_string(text)}) Tj ET\n"
+                for top, text in report.page_lines(page_number)).encode('latin-1')
+            add_object(f"<< /Length {len(content)} >>\nstream\n".encode('ascii') + content + b"endstream")
+
+        xref_offset = f.tell()
+        f.write(f"xref\n0 {len(offsets) + 1}\n".encode('ascii'))
+        f.write(b"0000000000 65535 f \n")
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode('ascii'))
+        f.write(f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii'))
+
+    return path
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    report = SyntheticReport(int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+                             int(sys.argv[3]) if len(sys.argv) > 3 else 120)
+    write_pdf(report, sys.argv[1])
+    print(f"📄 {sys.argv[1]}: {report.page_count} pages, {len(report.territories)} territories, "
+          f"{report.product_count} products")
@@ -79,6 +79,15 @@ else
     exit 1
 fi
 
+# Build the optional compiled calculator backend (NumPy/pure Python are used without it)
+echo "⚙️  Building compiled calculator backend..."
+if (cd src && cythonize -i -3 -q calculator_cython.pyx) &> /dev/null; then
+    echo "✅ Compiled calculator backend built"
+else
+    echo "⚠️ Cython build skipped - using the NumPy calculator backend"
+fi
+python benchmarks/check_backend_parity.py
+
 # Setup directories and bashrc alias
 echo "📁 Setting up directories and command alias..."
 python setup_directories.py
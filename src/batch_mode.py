@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Batch Mode
+Extracts every territory of a report non-interactively, in parallel worker processes
+"""
+
+import os
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import calculator
+import result_cache
+
+def split_into_chunks(entries, chunk_count):
+    """Split territory entries into contiguous, similarly sized chunks (by page count)"""
+    chunk_count = max(1, min(chunk_count, len(entries)))
+    total_pages = sum(entry['last_page'] - entry['first_page'] + 1 for entry in entries)
+    pages_per_chunk = total_pages / chunk_count
+
+    chunks = [[] for _ in range(chunk_count)]
+    pages_before = 0
+    for entry in entries:
+        chunks[min(int(pages_before / pages_per_chunk), chunk_count - 1)].append(entry)
+        pages_before += entry['last_page'] - entry['first_page'] + 1
+    return [chunk for chunk in chunks if chunk]
+
+def extract_territory_chunk(pdf_path, entries):
+    """
+    Worker process: open the report once in one Tabula session and extract
+    each territory of the chunk from it.
+    Returns [(entry, (structured_data, zero_value_data, header_data), error)]:
+    error is None on success, else a message (and the data is None) - a
+    territory with no products at all counts as failed, not as zero sales.
+    """
+    import tabula_parser
+
+    results = []
+    with tabula_parser.TabulaSession(max_open_documents=1) as session:
+        for entry in entries:
+            try:
+                extracted = tabula_parser.extract_pdf_data_tabula(
+                    pdf_path, (entry['first_page'], entry['last_page']), session=session)
+            except Exception as e:
+                results.append((entry, None, f"{type(e).__name__}: {e}"))
+                continue
+            structured_data, zero_value_data, _ = extracted
+            if not len(structured_data) and not len(zero_value_data):
+                results.append((entry, None, "no products extracted"))
+            else:
+                results.append((entry, extracted, None))
+    return results
+
+def write_territory_result(output_dir, entry, structured_data, zero_value_data, header_data, target_share):
+    """Write <territory>.json with all products and totals; returns the totals"""
+    totals = calculator.calculate_totals(structured_data + zero_value_data)
+    national_avg = calculator.calculate_national_average(totals['total_accounted_val'], target_share)
+
+    safe_territory = entry['territory'].replace(' ', '_').replace('-', '_')
+    with open(os.path.join(output_dir, f"{safe_territory}.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            'territory': entry['territory'],
+            'group': entry['group'],
+            'pages': [entry['first_page'], entry['last_page']],
+            'header': header_data,
+            'totals': totals,
+            'national_average': national_avg,
+            'active_products': list(structured_data),
+            'zero_value_products': list(zero_value_data),
+        }, f, indent=2, ensure_ascii=False)
+
+    return totals, national_avg
+
+def run_batch(pdf_path, file_hash, entries, output_dir, target_share, workers=None, parser_version=None):
+    """
+    Extract every territory in entries and write per-territory results.
+    Territories already in the parsed-result cache are not extracted again;
+    the rest are split across worker processes (one JVM + one document open each).
+    A territory that fails (extraction error, no products, or its worker
+    process dying) is listed as an error; summary.txt is always written.
+    Returns a list of summary rows (failed territories carry an 'error').
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start_time = time.time()
+    summary = []
+
+    def record(entry, structured_data, zero_value_data, header_data):
+        totals, national_avg = write_territory_result(
+            output_dir, entry, structured_data, zero_value_data, header_data, target_share)
+        summary.append({
+            'territory': entry['territory'],
+            'pages': f"{entry['first_page']}-{entry['last_page']}",
+            'active': len(structured_data),
+            'zero': len(zero_value_data),
+            'total_accounted_val': totals['total_accounted_val'],
+            'national_average': national_avg,
+        })
+        print(f"✅ {entry['territory']}: {len(structured_data)} active, {len(zero_value_data)} zero-value products")
+
+    def record_error(entry, message):
+        summary.append({
+            'territory': entry['territory'],
+            'pages': f"{entry['first_page']}-{entry['last_page']}",
+            'error': message,
+        })
+        print(f"❌ {entry['territory']}: extraction failed ({message})")
+
+    try:
+        pending = []
+        for entry in entries:
+            cached = result_cache.load_cached_result(file_hash, entry['first_page'], entry['last_page'], parser_version)
+            if cached:
+                record(entry, *cached)
+            else:
+                pending.append(entry)
+
+        if pending:
+            workers = workers or os.cpu_count() or 1
+            chunks = split_into_chunks(pending, workers)
+            print(f"⚙️  Extracting {len(pending)} territories with {len(chunks)} worker process(es)...")
+
+            # spawn: every worker starts its own clean JVM
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+                futures = {pool.submit(extract_territory_chunk, pdf_path, chunk): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        # Worker crashed (JVM crash, out of memory, BrokenProcessPool)
+                        for entry in futures[future]:
+                            record_error(entry, f"worker process died: {type(e).__name__}: {e}")
+                        continue
+                    for entry, extracted, error in results:
+                        if error:
+                            record_error(entry, error)
+                            continue
+                        result_cache.save_cached_result(file_hash, entry['first_page'], entry['last_page'], parser_version,
+                                                        *extracted)
+                        record(entry, *extracted)
+    finally:
+        summary.sort(key=lambda row: int(row['pages'].split('-')[0]))
+        write_summary(output_dir, pdf_path, summary, time.time() - start_time)
+    return summary
+
+def write_summary(output_dir, pdf_path, summary, elapsed):
+    """Write summary.txt with one line per territory"""
+    lines = [
+        "--- IPL SALES BATCH REPORT ---",
+        f"PDF: {os.path.basename(pdf_path)}",
+        f"Territories: {len(summary)}",
+        f"Failed: {sum('error' in row for row in summary)}",
+        f"Time: {elapsed:.1f}s",
+        "",
+        f"{'Territory':<12}{'Pages':<12}{'Active':>8}{'Zero':>8}{'Accounted (Taka)':>20}{'Nat. Avg':>10}",
+    ]
+    for row in summary:
+        if 'error' in row:
+            lines.append(f"{row['territory']:<12}{row['pages']:<12}  FAILED: {row['error']}")
+            continue
+        lines.append(f"{row['territory']:<12}{row['pages']:<12}{row['active']:>8}{row['zero']:>8}"
+                     f"{row['total_accounted_val']:>20.2f}{row['national_average']:>10.2f}")
+
+    with open(os.path.join(output_dir, "summary.txt"), 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Calculator Backend Selection
+Picks the fastest available calculator backend at import time:
+compiled (Cython) -> NumPy -> pure Python.
+Set IPL_CALCULATOR_BACKEND=cython|numpy|python to force one.
+"""
+
+import os
+import importlib
+
+import calculator_pure_python
+
+BACKEND_ENV_VAR = "IPL_CALCULATOR_BACKEND"
+BACKEND_ORDER = ("cython", "numpy", "python")
+BACKEND_MODULES = {
+    "cython": "calculator_cython",
+    "numpy": "calculator_numpy",
+    "python": "calculator_pure_python",
+}
+FUNCTION_NAMES = ("calculate_totals", "calculate_national_average", "filter_products_by_activity",
+                  "search_products", "verify_data_consistency")
+
+class _PurePythonBackend:
+    """calculator_pure_python under the common function names (the reference implementation)"""
+    calculate_totals = staticmethod(calculator_pure_python.calculate_totals_python)
+    calculate_national_average = staticmethod(calculator_pure_python.calculate_national_average_python)
+    filter_products_by_activity = staticmethod(calculator_pure_python.filter_products_by_activity_python)
+    search_products = staticmethod(calculator_pure_python.search_products_python)
+    verify_data_consistency = staticmethod(calculator_pure_python.verify_data_consistency_python)
+
+def load_backend(name):
+    """Backend module for a name, or None if it can't be imported"""
+    if name == "python":
+        return _PurePythonBackend
+    try:
+        return importlib.import_module(BACKEND_MODULES[name])
+    except Exception:
+        return None
+
+def available_backends():
+    return [name for name in BACKEND_ORDER if load_backend(name) is not None]
+
+def select_backend(requested=None):
+    """(name, module) of the requested backend, else the first one that imports"""
+    requested = (requested or os.environ.get(BACKEND_ENV_VAR, "")).strip().lower()
+    if requested in BACKEND_MODULES:
+        backend = load_backend(requested)
+        if backend is not None:
+            return requested, backend
+
+    for name in BACKEND_ORDER:
+        backend = load_backend(name)
+        if backend is not None:
+            return name, backend
+
+BACKEND_NAME, _backend = select_backend()
+
+calculate_totals = _backend.calculate_totals
+calculate_national_average = _backend.calculate_national_average
+filter_products_by_activity = _backend.filter_products_by_activity
+search_products = _backend.search_products
+verify_data_consistency = _backend.verify_data_consistency
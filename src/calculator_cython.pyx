@@ -0,0 +1,112 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+IPL Sales Analyzer - Compiled Calculator Backend
+Typed single-pass loops over ProductTable columns
+
+Build (install.sh does this when Cython and a C compiler are available):
+    cd src && cythonize -i -3 calculator_cython.pyx
+"""
+
+import numpy as np
+
+from product_table import ProductTable
+
+def _as_table(product_data):
+    if isinstance(product_data, ProductTable):
+        return product_data, True
+    return ProductTable.from_dicts(product_data), False
+
+def _same_kind(table, was_table):
+    return table if was_table else table.to_dicts()
+
+def activity_mask(const long long[:] sold_qty, const long long[:] int_qty,
+                  const double[:] sold_val, const double[:] int_val, const double[:] total_val):
+    """Boolean mask of products with any sold / in-transit activity"""
+    cdef Py_ssize_t i, n = sold_qty.shape[0]
+    mask = np.zeros(n, dtype=np.uint8)
+    cdef unsigned char[:] out = mask
+    for i in range(n):
+        out[i] = (sold_qty[i] > 0 or int_qty[i] > 0 or sold_val[i] > 0
+                  or int_val[i] > 0 or total_val[i] > 0)
+    return mask.view(np.bool_)
+
+def _totals(const long long[:] tgt_qty, const long long[:] sold_qty, const long long[:] int_qty,
+            const double[:] tgt_val, const double[:] sold_val, const double[:] int_val,
+            const double[:] total_val):
+    cdef Py_ssize_t i, n = tgt_qty.shape[0]
+    cdef double total_tgt_qty = 0.0, total_sold_qty = 0.0, total_int_qty = 0.0
+    cdef double total_tgt_val = 0.0, total_sold_val = 0.0, total_int_val = 0.0
+    cdef double total_accounted_val = 0.0
+
+    for i in range(n):
+        total_tgt_qty += tgt_qty[i]
+        total_tgt_val += tgt_val[i]
+        if (sold_qty[i] > 0 or int_qty[i] > 0 or sold_val[i] > 0
+                or int_val[i] > 0 or total_val[i] > 0):
+            total_sold_qty += sold_qty[i]
+            total_int_qty += int_qty[i]
+            total_sold_val += sold_val[i]
+            total_int_val += int_val[i]
+            total_accounted_val += total_val[i]
+
+    cdef double calculated_accounted_val = total_sold_val + total_int_val
+    if abs(total_accounted_val - calculated_accounted_val) > 0.01:
+        total_accounted_val = calculated_accounted_val
+
+    return {
+        'total_tgt_qty': total_tgt_qty,
+        'total_sold_qty': total_sold_qty,
+        'total_int_qty': total_int_qty,
+        'total_tgt_val': total_tgt_val,
+        'total_sold_val': total_sold_val,
+        'total_int_val': total_int_val,
+        'total_accounted_val': total_accounted_val,
+        'total_accounted_qty': total_sold_qty + total_int_qty
+    }
+
+def calculate_totals(product_data):
+    """Calculate totals for product data - compiled version"""
+    table, _ = _as_table(product_data)
+    return _totals(table.tgt_qty, table.sold_qty, table.int_qty,
+                   table.tgt_val, table.sold_val, table.int_val, table.total_val)
+
+def calculate_national_average(total_accounted_val, target_share):
+    """Calculate national average - scalar, same arithmetic as every backend"""
+    if total_accounted_val > 0 and target_share > 0:
+        return round((total_accounted_val / target_share) / 100000, 2)
+    return 0.0
+
+def filter_products_by_activity(product_data):
+    """Filter products based on activity - compiled version"""
+    table, was_table = _as_table(product_data)
+    active, inactive = table.split_by_activity()
+    return _same_kind(active, was_table), _same_kind(inactive, was_table)
+
+def search_products(product_data, search_query):
+    """Search products by brand name - compiled version (string matching stays in Python)"""
+    table, was_table = _as_table(product_data)
+    matching, zero_matches = table.search(search_query)
+    return _same_kind(matching, was_table), _same_kind(zero_matches, was_table)
+
+def verify_data_consistency(product_data):
+    """Verify data consistency and correct any mismatches - compiled version"""
+    table, was_table = _as_table(product_data)
+    cdef const double[:] sold_val = table.sold_val
+    cdef const double[:] int_val = table.int_val
+    cdef const double[:] total_val = table.total_val
+    cdef Py_ssize_t i, n = total_val.shape[0]
+    corrected = np.empty(n, dtype=np.float64)
+    cdef double[:] out = corrected
+    cdef double calculated_total
+
+    for i in range(n):
+        calculated_total = sold_val[i] + int_val[i]
+        if abs(total_val[i] - calculated_total) > 0.01:
+            out[i] = calculated_total
+        else:
+            out[i] = total_val[i]
+
+    columns = {field: getattr(table, field) for field in ProductTable.__slots__}
+    columns['total_val'] = corrected
+    columns['active'] = activity_mask(table.sold_qty, table.int_qty, table.sold_val, table.int_val, corrected)
+    return _same_kind(ProductTable(columns), was_table)
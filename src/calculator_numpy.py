@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - NumPy Calculator Backend
+Vectorised calculator functions over ProductTable columns
+"""
+
+from product_table import ProductTable
+
+def _as_table(product_data):
+    """(ProductTable, was_table) - lists of product dicts are converted once"""
+    if isinstance(product_data, ProductTable):
+        return product_data, True
+    return ProductTable.from_dicts(product_data), False
+
+def _same_kind(table, was_table):
+    """Hand back the caller's kind of collection"""
+    return table if was_table else table.to_dicts()
+
+def calculate_totals(product_data):
+    """
+    Calculate totals for product data - NumPy version
+    Targets from all products, sold/in-transit from products with activity
+    """
+    table, _ = _as_table(product_data)
+    return table.totals()
+
+def calculate_national_average(total_accounted_val, target_share):
+    """
+    Calculate national average - scalar, same arithmetic as every backend
+    """
+    if total_accounted_val > 0 and target_share > 0:
+        return round((total_accounted_val / target_share) / 100000, 2)
+    return 0.0
+
+def filter_products_by_activity(product_data):
+    """
+    Filter products based on activity - NumPy version
+    Returns active_products, inactive_products
+    """
+    table, was_table = _as_table(product_data)
+    active, inactive = table.split_by_activity()
+    return _same_kind(active, was_table), _same_kind(inactive, was_table)
+
+def search_products(product_data, search_query):
+    """
+    Search products by brand name - NumPy version
+    Returns ALL matching products (including zero-sales) for target calculations
+    """
+    table, was_table = _as_table(product_data)
+    matching, zero_matches = table.search(search_query)
+    return _same_kind(matching, was_table), _same_kind(zero_matches, was_table)
+
+def verify_data_consistency(product_data):
+    """
+    Verify data consistency and correct any mismatches - NumPy version
+    """
+    table, was_table = _as_table(product_data)
+    return _same_kind(table.verify_consistency(), was_table)
@@ -2,12 +2,24 @@
 """
 IPL Sales Analyzer - Pure Python Calculator Fallback
 Python implementation of calculator functions when Cython is not available
+Each function also accepts a ProductTable and then works on its columns
 """
 
+try:
+    from product_table import ProductTable
+except ImportError:
+    ProductTable = None
+
+def _is_product_table(product_data):
+    return ProductTable is not None and isinstance(product_data, ProductTable)
+
 def calculate_totals_python(product_data):
     """
     Calculate totals for product data - Python fallback version
     """
+    if _is_product_table(product_data):
+        return product_data.totals()
+
     total_tgt_qty = 0.0
     total_sold_qty = 0.0
     total_int_qty = 0.0
@@ -72,6 +84,9 @@ def filter_products_by_activity_python(product_data):
     Filter products based on activity - Python fallback version
     Returns two lists: active_products, inactive_products
     """
+    if _is_product_table(product_data):
+        return product_data.split_by_activity()
+
     active_products = []
     inactive_products = []
     
@@ -96,6 +111,9 @@ def search_products_python(product_data, search_query):
     Search products by brand name - Python fallback version
     Returns ALL matching products (including zero-sales) for target calculations
     """
+    if _is_product_table(product_data):
+        return product_data.search(search_query)
+
     matching_products = []
     zero_matches = []
     query_lower = search_query.lower()
@@ -124,6 +142,9 @@ def verify_data_consistency_python(product_data):
     Verify data consistency and correct any mismatches - Python fallback
     Returns corrected product data
     """
+    if _is_product_table(product_data):
+        return product_data.verify_consistency()
+
     corrected_data = []
     
     for product in product_data:
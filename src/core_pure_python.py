@@ -61,11 +61,133 @@ def extract_date_range_python(text_content):
     else:
         return "Unknown Date Range"
 
+# Product line classifier: one compiled scan for the header/footer words, then
+# a right split that peels off the seven value columns and converts each number
+# once. Lines with fewer than seven trailing numbers take the general path.
+SKIP_WORDS = ["Territory Wise Sale", "Group:", "Terr Id:", "Code Brand Name", "Page", "Total :"]
+SKIP_PATTERN = re.compile('|'.join(re.escape(word) for word in SKIP_WORDS))
+EXPECTED_NUM_VALUES = 7
+
+class ProductLine:
+    """One parsed product line"""
+    __slots__ = ('code', 'brand_name', 'tgt_qty', 'sold_qty', 'int_qty',
+                 'tgt_val', 'sold_val', 'int_val', 'total_val', 'has_activity')
+
+    def __init__(self, code, brand_name, tgt_qty, sold_qty, int_qty, tgt_val, sold_val, int_val, total_val):
+        self.code = code
+        self.brand_name = brand_name
+        self.tgt_qty = tgt_qty
+        self.sold_qty = sold_qty
+        self.int_qty = int_qty
+        self.tgt_val = tgt_val
+        self.sold_val = sold_val
+        self.int_val = int_val
+        self.total_val = total_val
+        self.has_activity = (sold_qty > 0 or int_qty > 0 or sold_val > 0 or int_val > 0 or total_val > 0)
+
+    def as_dict(self):
+        """The dict parse_product_line_python has always returned"""
+        return {
+            'code': self.code,
+            'brand_name': self.brand_name,
+            'tgt_qty': self.tgt_qty,
+            'sold_qty': self.sold_qty,
+            'int_qty': self.int_qty,
+            'tgt_val': self.tgt_val,
+            'sold_val': self.sold_val,
+            'int_val': self.int_val,
+            'total_val': self.total_val,
+            'has_activity': self.has_activity
+        }
+
+# A token float() accepts ends in a digit, '.', or the last letter of nan/inf/infinity
+NUMBER_END_CHARS = frozenset('.nNfFyY')
+
+def _is_number(token):
+    if not (token[-1].isdigit() or token[-1] in NUMBER_END_CHARS):
+        return False
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+def _split_numbers(parts):
+    """(brand_parts, numbers) for a line with fewer than 7 trailing numbers"""
+    numbers = []
+    for i in range(len(parts) - 1, 0, -1):
+        try:
+            numbers.append(float(parts[i]))
+        except ValueError:
+            break
+    numbers.reverse()
+    return parts[1:len(parts) - len(numbers)], numbers
+
+def classify_product_line(line):
+    """
+    Parse a single product line
+    Returns a ProductLine, or None for header/footer/invalid lines
+    """
+    if SKIP_PATTERN.search(line):
+        return None
+
+    parts = line.rsplit(None, EXPECTED_NUM_VALUES)
+    if len(parts) < 3:
+        return None
+
+    numbers = None
+    if len(parts) > EXPECTED_NUM_VALUES:
+        try:
+            numbers = list(map(float, parts[1:]))
+        except ValueError:
+            pass
+
+    if numbers is not None:
+        head = parts[0].split()
+        code = head[0]
+        # Numbers right before the value columns belong to the run, not the brand
+        brand_end = len(head)
+        while brand_end > 1 and _is_number(head[brand_end - 1]):
+            brand_end -= 1
+        brand_name_parts = head[1:brand_end]
+    else:
+        parts = parts[0].split() + parts[1:]
+        code = parts[0]
+        brand_name_parts, numbers = _split_numbers(parts)
+        if not numbers:
+            return None
+        numbers += [0.0] * (EXPECTED_NUM_VALUES - len(numbers))
+
+    if not brand_name_parts:
+        return None
+
+    tgt_qty, sold_qty, int_qty, tgt_val, sold_val, int_val, total_val = numbers
+    try:
+        tgt_qty, sold_qty, int_qty = int(tgt_qty), int(sold_qty), int(int_qty)
+    except ValueError:
+        return None
+
+    # Verify and correct total value
+    calculated_total = sold_val + int_val
+    if abs(total_val - calculated_total) > 0.01:
+        total_val = calculated_total
+
+    return ProductLine(code, ' '.join(brand_name_parts), tgt_qty, sold_qty, int_qty,
+                       tgt_val, sold_val, int_val, total_val)
+
 def parse_product_line_python(line):
     """
     Parse a single product line - Python fallback
     Returns product data or None if invalid
     """
+    product = classify_product_line(line)
+    return product.as_dict() if product else None
+
+def parse_product_line_reference(line):
+    """
+    Parse a single product line - original token-by-token version
+    Kept as the reference for parse_product_line_python (see benchmarks/bench_line_parser.py)
+    """
     # Skip header/footer lines
     skip_words = ["Territory Wise Sale", "Group:", "Terr Id:", "Code Brand Name", "Page", "Total :"]
     for word in skip_words:
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Incremental Downloads Scanner
+Finds candidate report PDFs in the Download folders without re-listing unchanged directories
+"""
+
+import os
+import json
+from pathlib import Path
+
+DOWNLOAD_FOLDERS = [
+    "/storage/emulated/0/Download",
+    "/storage/emulated/0/Downloads",
+    "/storage/emulated/0/download",
+    "/storage/emulated/0/downloads"
+]
+SCAN_STATE_FILE = Path(__file__).parent / "downloads_scan_state.json"
+
+# Typical Territory Wise Sale report size
+MIN_SIZE_MB = 5.0
+MAX_SIZE_MB = 6.0
+
+def load_scan_state(state_file=SCAN_STATE_FILE):
+    """Per-directory state from the last scan: {real_path: {mtime_ns, subdirs, pdfs}}"""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def save_scan_state(state, state_file=SCAN_STATE_FILE):
+    try:
+        temp_file = Path(state_file).with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_file, state_file)
+    except Exception:
+        pass
+
+def unique_roots(folders):
+    """
+    Existing download roots with aliases removed.
+    On Android, Download/download/Downloads often point at the same directory,
+    so roots are compared by real path and by (device, inode).
+    """
+    roots = []
+    seen = set()
+    for folder in folders:
+        try:
+            stat = os.stat(folder)
+        except OSError:
+            continue
+        real_path = os.path.realpath(folder)
+        identity = (stat.st_dev, stat.st_ino)
+        if real_path in seen or identity in seen:
+            continue
+        seen.add(real_path)
+        seen.add(identity)
+        roots.append((folder, real_path, stat))
+    return roots
+
+def _list_directory(directory):
+    """One os.scandir pass: (subdir names, {pdf name: stat}, entries seen)"""
+    subdirs = []
+    pdfs = {}
+    entries_seen = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            entries_seen += 1
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                    # DirEntry caches its stat result, no extra syscall per file later
+                    pdfs[entry.name] = entry.stat()
+            except OSError:
+                continue
+    return subdirs, pdfs, entries_seen
+
+def scan_downloads_for_pdfs(folders=None, progress=None, state_file=SCAN_STATE_FILE):
+    """
+    Scan download folders for candidate report PDFs (5-6 MB).
+    Directories whose mtime is unchanged since the last scan are not listed
+    again: their remembered PDFs are re-stat'ed and their remembered
+    subdirectories are checked the same way.
+    progress, if given, is called with the number of directory entries examined.
+    """
+    folders = folders or DOWNLOAD_FOLDERS
+    previous_state = load_scan_state(state_file)
+    new_state = {}
+    candidate_pdfs = []
+    visited = set()
+
+    for root_folder, root_real, root_stat in unique_roots(folders):
+        stack = [(root_real, root_stat)]
+
+        while stack:
+            directory, dir_stat = stack.pop()
+            identity = (dir_stat.st_dev, dir_stat.st_ino)
+            if identity in visited:
+                continue
+            visited.add(identity)
+
+            cached = previous_state.get(directory)
+            try:
+                if cached and cached['mtime_ns'] == dir_stat.st_mtime_ns:
+                    # Unchanged directory: only the PDFs we already know about need a stat
+                    subdirs = cached['subdirs']
+                    pdfs = {}
+                    for name in cached['pdfs']:
+                        try:
+                            pdfs[name] = os.stat(os.path.join(directory, name))
+                        except OSError:
+                            continue
+                    entries_seen = len(cached['pdfs'])
+                else:
+                    subdirs, pdfs, entries_seen = _list_directory(directory)
+            except OSError:
+                continue
+
+            new_state[directory] = {
+                'mtime_ns': dir_stat.st_mtime_ns,
+                'subdirs': subdirs,
+                'pdfs': sorted(pdfs),
+            }
+            if progress:
+                progress(entries_seen)
+
+            for name, file_stat in pdfs.items():
+                file_size = file_stat.st_size / (1024 * 1024)
+                if MIN_SIZE_MB <= file_size <= MAX_SIZE_MB:
+                    file_path = os.path.join(directory, name)
+                    display_root = directory.replace(root_real, root_folder, 1)
+                    candidate_pdfs.append({
+                        'path': file_path,
+                        'name': name,
+                        'size_mb': file_size,
+                        'creation_time': file_stat.st_ctime,
+                        'source_folder': display_root,
+                        'relative_path': os.path.relpath(file_path, root_real) if directory != root_real else name
+                    })
+
+            for name in subdirs:
+                subdir = os.path.join(directory, name)
+                try:
+                    stack.append((subdir, os.stat(subdir)))
+                except OSError:
+                    continue
+
+    save_scan_state(new_state, state_file)
+    return candidate_pdfs
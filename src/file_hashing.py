@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - File Hashing
+Large-block file hashing with selectable algorithm
+"""
+
+import hashlib
+
+# New registry entries use BLAKE2b-256; rows written by older versions are MD5
+DEFAULT_ALGORITHM = "blake2b"
+LEGACY_ALGORITHM = "md5"
+BLOCK_SIZE = 1024 * 1024          # 1 MB reads instead of 4 KB
+
+# Hex digest length -> algorithm, so stored hashes identify themselves
+DIGEST_ALGORITHMS = {64: "blake2b", 32: "md5"}
+
+def new_hasher(algorithm=DEFAULT_ALGORITHM):
+    """Create a hash object; BLAKE2b is truncated to 256 bits"""
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algorithm)
+
+def hash_algorithm(hex_digest):
+    """Algorithm that produced a stored hex digest (None if unknown)"""
+    return DIGEST_ALGORITHMS.get(len(hex_digest or ""))
+
+def is_legacy_hash(hex_digest):
+    return hash_algorithm(hex_digest) == LEGACY_ALGORITHM
+
+def hash_file(file_path, algorithms=(DEFAULT_ALGORITHM,), progress=None):
+    """
+    Hash a file with one or more algorithms in a single read pass.
+    Returns {algorithm: hex_digest}, or None if the file can't be read.
+    progress, if given, is called with the number of bytes read.
+    """
+    try:
+        # Fast path: let hashlib drive the reads itself (Python 3.11+)
+        if len(algorithms) == 1 and progress is None and hasattr(hashlib, "file_digest"):
+            with open(file_path, "rb") as f:
+                digest = hashlib.file_digest(f, lambda: new_hasher(algorithms[0]))
+            return {algorithms[0]: digest.hexdigest()}
+
+        hashers = [(algorithm, new_hasher(algorithm)) for algorithm in algorithms]
+
+        with open(file_path, "rb") as f:
+            buffer = bytearray(BLOCK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                for _, hasher in hashers:
+                    hasher.update(view[:size])
+                if progress:
+                    progress(size)
+
+        return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers}
+    except OSError:
+        return None
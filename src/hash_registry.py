@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - PDF Hash Registry
+SQLite-backed registry of known report PDFs and remembered file hashes
+"""
+
+import os
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REGISTRY_DB_FILE = "pdf_registry.db"
+LEGACY_REGISTRY_FILE = "pdf_hash_registry.txt"
+LEGACY_STAT_CACHE_FILE = "pdf_stat_cache.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdf_registry (
+    hash TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    size_mb TEXT,
+    source TEXT,
+    import_date TEXT,
+    date_range TEXT,
+    printed_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pdf_registry_filename ON pdf_registry(filename);
+
+CREATE TABLE IF NOT EXISTS file_stats (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_file_stats_hash ON file_stats(hash);
+
+CREATE TABLE IF NOT EXISTS territory_index (
+    hash TEXT NOT NULL,
+    territory TEXT NOT NULL,
+    first_page INTEGER NOT NULL,
+    last_page INTEGER NOT NULL,
+    grp TEXT,
+    period TEXT,
+    PRIMARY KEY (hash, territory)
+);
+
+CREATE TABLE IF NOT EXISTS engine_checks (
+    hash TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    detail TEXT,
+    checked_at TEXT,
+    PRIMARY KEY (hash, engine)
+);
+"""
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+class HashRegistry:
+    """
+    Registry of imported PDFs keyed by content hash.
+    Lookups go through the primary key / indexes, so they cost the same
+    no matter how many reports have been imported over time.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = str(db_path or SCRIPT_DIR / REGISTRY_DB_FILE)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.migrate_legacy_files()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    # Report entries
+    def lookup(self, file_hash):
+        """Registry entry for a hash as a dict, or None"""
+        if not file_hash:
+            return None
+        row = self.conn.execute("SELECT * FROM pdf_registry WHERE hash = ?", (file_hash,)).fetchone()
+        return dict(row) if row else None
+
+    def contains(self, file_hash):
+        return self.lookup(file_hash) is not None
+
+    def record_import(self, file_hash, filename, file_size, source_folder):
+        """Record an import from Downloads (import date is refreshed on re-import)"""
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO pdf_registry (hash, filename, size_mb, source, import_date)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(hash) DO UPDATE SET
+                       filename = excluded.filename,
+                       size_mb = excluded.size_mb,
+                       source = excluded.source,
+                       import_date = excluded.import_date""",
+                (file_hash, filename, f"{file_size:.2f}MB", source_folder, _now()))
+
+    def record_dates(self, file_hash, filename, file_size, source_folder, date_range, printed_date):
+        """Record the report period/printed date, keeping the original import date"""
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO pdf_registry (hash, filename, size_mb, source, import_date, date_range, printed_date)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(hash) DO UPDATE SET
+                       date_range = excluded.date_range,
+                       printed_date = excluded.printed_date""",
+                (file_hash, filename, f"{file_size:.2f}MB", source_folder, _now(), date_range, printed_date))
+
+    def has_legacy_hashes(self):
+        """True while MD5 rows written by older versions are still in the registry"""
+        return self.conn.execute(
+            "SELECT 1 FROM pdf_registry WHERE length(hash) = 32 LIMIT 1").fetchone() is not None
+
+    def upgrade_hash(self, old_hash, new_hash):
+        """Re-key a legacy (MD5) entry to its new hash, keeping its dates"""
+        if not old_hash or not new_hash or old_hash == new_hash:
+            return False
+        with self.conn:
+            if self.conn.execute("SELECT 1 FROM pdf_registry WHERE hash = ?", (new_hash,)).fetchone():
+                self.conn.execute("DELETE FROM pdf_registry WHERE hash = ?", (old_hash,))
+            else:
+                self.conn.execute("UPDATE pdf_registry SET hash = ? WHERE hash = ?", (new_hash, old_hash))
+            self.conn.execute("UPDATE file_stats SET hash = ? WHERE hash = ?", (new_hash, old_hash))
+            self.conn.execute("UPDATE OR IGNORE territory_index SET hash = ? WHERE hash = ?", (new_hash, old_hash))
+            self.conn.execute("UPDATE OR IGNORE engine_checks SET hash = ? WHERE hash = ?", (new_hash, old_hash))
+        return True
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM pdf_registry").fetchone()[0]
+
+    # Stat-based fast path: (path, size, mtime_ns, inode) -> hash
+    def get_stat_hash(self, path, signature):
+        """Remembered hash for path if its size/mtime/inode still match, else None"""
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, inode, hash FROM file_stats WHERE path = ?", (path,)).fetchone()
+        if row and [row['size'], row['mtime_ns'], row['inode']] == list(signature):
+            return row['hash']
+        return None
+
+    def set_stat_hash(self, path, signature, file_hash):
+        size, mtime_ns, inode = signature
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO file_stats (path, size, mtime_ns, inode, hash) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET
+                       size = excluded.size, mtime_ns = excluded.mtime_ns,
+                       inode = excluded.inode, hash = excluded.hash""",
+                (path, size, mtime_ns, inode, file_hash))
+
+    def paths_for_hash(self, file_hash):
+        """Every remembered path whose content has this hash"""
+        return [row['path'] for row in self.conn.execute(
+            "SELECT path FROM file_stats WHERE hash = ?", (file_hash,))]
+
+    def prune_stats(self):
+        """Forget remembered hashes of files that no longer exist"""
+        missing = [(row['path'],) for row in self.conn.execute("SELECT path FROM file_stats")
+                   if not os.path.exists(row['path'])]
+        if missing:
+            with self.conn:
+                self.conn.executemany("DELETE FROM file_stats WHERE path = ?", missing)
+        return len(missing)
+
+    # Territory index: territory -> page range, per report hash
+    def get_territory_index(self, file_hash):
+        """Indexed territories of a report ordered by first page ([] if not indexed yet)"""
+        if not file_hash:
+            return []
+        return [{
+            'territory': row['territory'],
+            'first_page': row['first_page'],
+            'last_page': row['last_page'],
+            'group': row['grp'],
+            'period': row['period'],
+        } for row in self.conn.execute(
+            "SELECT * FROM territory_index WHERE hash = ? ORDER BY first_page", (file_hash,))]
+
+    def save_territory_index(self, file_hash, entries):
+        """Replace the stored territory index of a report"""
+        with self.conn:
+            self.conn.execute("DELETE FROM territory_index WHERE hash = ?", (file_hash,))
+            self.conn.executemany(
+                """INSERT INTO territory_index (hash, territory, first_page, last_page, grp, period)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [(file_hash, entry['territory'], entry['first_page'], entry['last_page'],
+                  entry['group'], entry['period']) for entry in entries])
+
+    # Extraction engine cross-checks, per report hash and page range
+    @staticmethod
+    def _engine_key(engine, first_page, last_page):
+        return f"{engine}:{first_page}-{last_page}"
+
+    def get_engine_verdict(self, file_hash, engine, first_page, last_page):
+        """Stored cross-check verdict ('match' / 'mismatch') of an engine for a page range of a report, or None"""
+        if not file_hash:
+            return None
+        row = self.conn.execute(
+            "SELECT verdict FROM engine_checks WHERE hash = ? AND engine = ?",
+            (file_hash, self._engine_key(engine, first_page, last_page))).fetchone()
+        return row['verdict'] if row else None
+
+    def set_engine_verdict(self, file_hash, engine, first_page, last_page, verdict, detail=None):
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO engine_checks (hash, engine, verdict, detail, checked_at) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(hash, engine) DO UPDATE SET
+                       verdict = excluded.verdict, detail = excluded.detail, checked_at = excluded.checked_at""",
+                (file_hash, self._engine_key(engine, first_page, last_page), verdict, detail, _now()))
+
+    # One-shot migration from the old text files
+    def migrate_legacy_files(self):
+        """Import pdf_hash_registry.txt and pdf_stat_cache.json once, then rename them"""
+        legacy_registry = SCRIPT_DIR / LEGACY_REGISTRY_FILE
+        if legacy_registry.exists():
+            try:
+                self._import_legacy_registry(legacy_registry)
+                legacy_registry.rename(legacy_registry.with_name(legacy_registry.name + ".migrated"))
+            except Exception:
+                pass
+
+        legacy_stats = SCRIPT_DIR / LEGACY_STAT_CACHE_FILE
+        if legacy_stats.exists():
+            try:
+                with open(legacy_stats, 'r', encoding='utf-8') as f:
+                    stat_cache = json.load(f)
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO file_stats (path, size, mtime_ns, inode, hash) VALUES (?, ?, ?, ?, ?)",
+                        [(path, *entry['stat'], entry['hash']) for path, entry in stat_cache.items()])
+                legacy_stats.rename(legacy_stats.with_name(legacy_stats.name + ".migrated"))
+            except Exception:
+                pass
+
+    def _import_legacy_registry(self, registry_file):
+        """
+        Both historical row formats are kept:
+        hash|filename|size|source|import_date
+        hash|filename|size|source|import_date|date_range|printed_date
+        Later rows for the same hash win, but never erase known dates.
+        """
+        with open(registry_file, 'r', encoding='utf-8') as f, self.conn:
+            for line in f:
+                parts = line.strip().split('|')
+                if len(parts) < 5 or not parts[0]:
+                    continue
+
+                file_hash, filename, size_mb, source, import_date = parts[:5]
+                date_range = parts[5] if len(parts) > 5 else None
+                printed_date = parts[6] if len(parts) > 6 else None
+
+                self.conn.execute(
+                    """INSERT INTO pdf_registry (hash, filename, size_mb, source, import_date, date_range, printed_date)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(hash) DO UPDATE SET
+                           filename = excluded.filename,
+                           size_mb = excluded.size_mb,
+                           source = excluded.source,
+                           import_date = excluded.import_date,
+                           date_range = COALESCE(excluded.date_range, pdf_registry.date_range),
+                           printed_date = COALESCE(excluded.printed_date, pdf_registry.printed_date)""",
+                    (file_hash, filename, size_mb, source, import_date, date_range, printed_date))
+
+_registry = None
+
+def get_registry():
+    """Shared registry connection for the whole run"""
+    global _registry
+    if _registry is None:
+        _registry = HashRegistry()
+    return _registry
+
+def close_registry():
+    global _registry
+    if _registry is not None:
+        _registry.close()
+        _registry = None
@@ -5,14 +5,16 @@ IPL Sales Analyzer - Final Version with Tabula Integration
 
 import os
 import sys
-import subprocess
+import io
+import atexit
+import importlib
 import shutil
-import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Color codes for terminal
 class Colors:
@@ -27,25 +29,49 @@ class Colors:
     BOLD = '\033[1m'
 
 # Import modules
+# Only light modules here: pandas/NumPy/Tabula are loaded by load_module()
+# when extraction or search actually runs, so -h / -v start instantly
 try:
-    import tabula_parser
-    TABULA_AVAILABLE = True
-except ImportError as e:
-    print(f"{Colors.RED}❌ Tabula parser not available: {e}{Colors.RESET}")
-    sys.exit(1)
-
-try:
-    import calculator_pure_python as calculator
-    import core_pure_python as core
+    import hash_registry
+    import file_hashing
+    import downloads_scanner
+    import territory_index
+    import profiling
+    from report_writer import ReportSink
 except ImportError as e:
     print(f"{Colors.RED}❌ Module import error: {e}{Colors.RESET}")
     sys.exit(1)
 
+def load_module(name):
+    """Import a heavy module (tabula_parser, calculator, result_cache, ...) on first use"""
+    try:
+        if name in sys.modules:
+            return sys.modules[name]
+        with profiling.stage(f"import.{name}"):
+            return importlib.import_module(name)
+    except ImportError as e:
+        if name == 'tabula_parser':
+            print(f"{Colors.RED}❌ Tabula parser not available: {e}{Colors.RESET}")
+        else:
+            print(f"{Colors.RED}❌ Module import error: {e}{Colors.RESET}")
+        sys.exit(1)
+
 # Configuration
 USER_DATA_FILE = "user_data.txt"
 TARGET_SHARE_FILE = "target_share.txt"
-HASH_REGISTRY_FILE = "pdf_hash_registry.txt"
 SCRIPT_DIR = Path(__file__).parent
+SALES_SOURCE_DIR = "/storage/emulated/0/SalesSource"
+REPORTS_DIR = "/storage/emulated/0/Analytics_Reports"
+PROFILES_DIR = os.path.join(REPORTS_DIR, "Profiles")
+HASH_WORKERS = 4
+PROBE_WORKERS = 2
+
+# Re-hash every file even when its size/mtime/inode are unchanged (report --verify)
+FORCE_HASH_VERIFY = os.environ.get('IPL_VERIFY_HASHES') == '1'
+
+# Extraction engine: 'tabula' (JVM) or 'text' (pdftotext + pure-Python line parser)
+EXTRACTION_ENGINES = ('tabula', 'text')
+EXTRACTION_ENGINE = os.environ.get('IPL_ENGINE', 'tabula').lower()
 
 # Professional Display Functions
 def clear_line():
@@ -62,149 +88,146 @@ def print_centered(text, color=Colors.WHITE):
     except:
         print(f"{color}{text}{Colors.RESET}")
 
-def show_progress(description, duration=8, color=Colors.CYAN):
-    """Show progress bar that clears after completion"""
-    frames = [
-        '▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▯',
-        '▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮▮'
-    ]
-    
-    start_time = time.time()
-    frame_count = len(frames)
-    
-    while time.time() - start_time < duration:
-        elapsed = time.time() - start_time
-        progress = min(elapsed / duration, 1.0)
-        current_frame = frames[min(int(progress * frame_count), frame_count - 1)]
-        percentage = int(progress * 100)
-        
+class ProgressBar:
+    """
+    Progress bar attached to real work (pages parsed, bytes hashed, files scanned).
+    Call update() as work is done; the bar completes as soon as the work does.
+    With no total it shows a running count instead of a percentage.
+    """
+    BAR_WIDTH = 26
+    REDRAW_INTERVAL = 0.1
+
+    def __init__(self, description, total=None, unit='', color=Colors.CYAN):
+        self.description = description
+        self.total = total
+        self.unit = unit
+        self.color = color
+        self.done = 0
+        self.start_time = time.time()
+        self._last_draw = 0.0
+        self._draw(force=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.finish(success=exc_type is None)
+
+    def __call__(self, amount=1):
+        self.update(amount)
+
+    def set_total(self, total):
+        self.total = total
+        self._draw(force=True)
+
+    def update(self, amount=1):
+        self.done += amount
+        self._draw()
+
+    def _draw(self, force=False):
+        now = time.time()
+        if not force and now - self._last_draw < self.REDRAW_INTERVAL:
+            return
+        self._last_draw = now
+
+        if self.total:
+            progress = min(self.done / self.total, 1.0)
+            filled = int(progress * self.BAR_WIDTH)
+            bar = '▮' * filled + '▯' * (self.BAR_WIDTH - filled)
+            status = f"[{bar}] {int(progress * 100)}%"
+        else:
+            status = f"{self.done} {self.unit}".strip()
+
         clear_line()
-        print(f"{color}🕒 {description}: [{current_frame}] {percentage}%{Colors.RESET}", end='\r')
-        time.sleep(0.1)
-    
-    clear_line()
-    print(f"{Colors.GREEN}✅ {description} completed{Colors.RESET}")
+        print(f"{self.color}🕒 {self.description}: {status}{Colors.RESET}", end='\r', flush=True)
+
+    def finish(self, success=True):
+        clear_line()
+        elapsed = time.time() - self.start_time
+        if success:
+            print(f"{Colors.GREEN}✅ {self.description} completed ({elapsed:.1f}s){Colors.RESET}")
+        else:
+            print(f"{Colors.RED}❌ {self.description} failed{Colors.RESET}")
 
 # Hash and File Functions
-def calculate_single_file_hash(file_path):
-    """Calculate MD5 hash of a file"""
-    hash_md5 = hashlib.md5()
-    try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    except Exception as e:
+def calculate_file_digests(file_path, with_legacy=False, progress=None):
+    """
+    Hash a file with the registry algorithm (BLAKE2b), plus MD5 in the same
+    pass when legacy registry rows still need to be matched. Thread-safe.
+    """
+    algorithms = [file_hashing.DEFAULT_ALGORITHM]
+    if with_legacy:
+        algorithms.append(file_hashing.LEGACY_ALGORITHM)
+    return file_hashing.hash_file(file_path, algorithms, progress)
+
+# Stat-based fast path: (path, size, mtime_ns, inode) -> hash
+def get_file_signature(file_path):
+    """Cheap identity of a file's content: size, mtime_ns and inode"""
+    stat = os.stat(file_path)
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+def get_remembered_hash(file_path, registry, force_verify=None):
+    """
+    Return (signature, remembered_hash, needs_hash) for a file.
+    needs_hash is True when size/mtime/inode changed, the remembered hash is
+    a legacy MD5 that should be upgraded, or force_verify is on.
+    """
+    if force_verify is None:
+        force_verify = FORCE_HASH_VERIFY
+
+    signature = get_file_signature(file_path)
+    remembered_hash = registry.get_stat_hash(file_path, signature)
+    needs_hash = force_verify or not remembered_hash or file_hashing.is_legacy_hash(remembered_hash)
+    return signature, remembered_hash, needs_hash
+
+def store_file_hash(file_path, signature, digests, registry, remembered_hash=None):
+    """
+    Remember freshly computed digests and return the registry hash.
+    A matching legacy MD5 registry row is re-keyed to the new hash.
+    """
+    if not digests:
         return None
 
-def load_hash_registry():
-    """Load existing PDF hashes from registry file"""
-    registry = set()
-    registry_file = SCRIPT_DIR / HASH_REGISTRY_FILE
-    
-    if registry_file.exists():
-        try:
-            with open(registry_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '|' in line:
-                        parts = line.split('|')
-                        if len(parts) >= 2:
-                            registry.add(parts[0])
-        except:
-            pass
-    
-    return registry
+    file_hash = digests[file_hashing.DEFAULT_ALGORITHM]
+    legacy_hash = digests.get(file_hashing.LEGACY_ALGORITHM)
+    if legacy_hash and registry.contains(legacy_hash):
+        registry.upgrade_hash(legacy_hash, file_hash)
+    elif remembered_hash and remembered_hash not in (file_hash, legacy_hash):
+        print(f"{Colors.YELLOW}⚠️  Hash changed without a size/time change: {os.path.basename(file_path)}{Colors.RESET}")
+
+    registry.set_stat_hash(file_path, signature, file_hash)
+    return file_hash
 
-def save_to_hash_registry(file_hash, filename, file_size, source_folder):
-    """Save new PDF hash to registry file"""
+def get_file_hash(file_path, registry, force_verify=None, progress=None):
+    """
+    Return the file hash, re-hashing only when size, mtime or inode changed.
+    force_verify re-hashes anyway and warns if the remembered hash was stale.
+    """
     try:
-        registry_file = SCRIPT_DIR / HASH_REGISTRY_FILE
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        registry_entry = f"{file_hash}|{filename}|{file_size:.2f}MB|{source_folder}|{timestamp}\n"
-        
-        with open(registry_file, 'a', encoding='utf-8') as f:
-            f.write(registry_entry)
-    except:
-        pass
+        signature, remembered_hash, needs_hash = get_remembered_hash(file_path, registry, force_verify)
+    except OSError:
+        return None
 
-# Enhanced Hash Registry with Date Storage
-def load_enhanced_hash_registry():
-    """Load hash registry with date range information"""
-    registry = {}
-    registry_file = SCRIPT_DIR / HASH_REGISTRY_FILE
-    
-    if registry_file.exists():
-        try:
-            with open(registry_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '|' in line:
-                        parts = line.split('|')
-                        if len(parts) >= 6:
-                            file_hash = parts[0]
-                            filename = parts[1]
-                            file_size = parts[2]
-                            source_folder = parts[3]
-                            import_date = parts[4]
-                            date_range = parts[5]
-                            printed_date = parts[6] if len(parts) > 6 else "Not available"
-                            
-                            registry[file_hash] = {
-                                'filename': filename,
-                                'size_mb': file_size,
-                                'source': source_folder,
-                                'import_date': import_date,
-                                'date_range': date_range,
-                                'printed_date': printed_date
-                            }
-        except:
-            pass
-    
-    return registry
+    if not needs_hash:
+        if progress:
+            progress(signature[0])
+        return remembered_hash
 
-def save_enhanced_hash_registry(file_hash, filename, file_size, source_folder, date_range, printed_date):
-    """Save to hash registry with date information"""
+    with profiling.stage('hash.file'):
+        digests = calculate_file_digests(file_path, registry.has_legacy_hashes(), progress)
+    return store_file_hash(file_path, signature, digests, registry, remembered_hash)
+
+def remember_file_hash(file_path, file_hash, registry):
+    """Record a known hash for a file (e.g. after moving it)"""
     try:
-        registry_file = SCRIPT_DIR / HASH_REGISTRY_FILE
-        import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        registry_entry = f"{file_hash}|{filename}|{file_size:.2f}MB|{source_folder}|{import_date}|{date_range}|{printed_date}\n"
-        
-        with open(registry_file, 'a', encoding='utf-8') as f:
-            f.write(registry_entry)
-    except:
+        registry.set_stat_hash(file_path, get_file_signature(file_path), file_hash)
+    except OSError:
         pass
 
-def extract_dates_from_pdf(file_path):
-    """Extract dates from PDF using Tabula"""
+def extract_dates_from_pdf(file_path, session=None):
+    """Extract dates from PDF using a Tabula session (the shared one by default)"""
     try:
-        header_data = tabula_parser.extract_header_from_cut_pdf(file_path)
+        header_data = load_module('tabula_parser').extract_header_info(file_path, session)
         
         date_range = "Date range not found"
         if header_data.get('period_from') and header_data.get('period_to'):
@@ -217,56 +240,96 @@ def extract_dates_from_pdf(file_path):
     except Exception as e:
         return "Date range not found", "Not available"
 
+def probe_pdf_dates(file_path):
+    """Header probe for a worker thread: own short-lived session, same JVM"""
+    with load_module('tabula_parser').TabulaSession(max_open_documents=1) as session:
+        return extract_dates_from_pdf(file_path, session)
+
 # Enhanced File Listing with Registry Dates - MODIFIED FOR IMPORT DATE SORTING
 def find_pdf_files_with_registry_dates():
-    """Find PDF files with date information from registry - SORTED BY IMPORT DATE"""
+    """
+    Find PDF files with date information from registry - SORTED BY IMPORT DATE
+    Changed files are hashed on a thread pool and unknown reports have their
+    headers probed on a small bounded pool, so listing costs about as much as
+    the slowest file instead of the sum of all of them.
+    """
     source_dir = "/storage/emulated/0/SalesSource"
     pdf_files = []
     
-    hash_registry = load_enhanced_hash_registry()
+    registry = hash_registry.get_registry()
     
     if not os.path.exists(source_dir):
         return []
     
     try:
         for file in os.listdir(source_dir):
-            if file.lower().endswith('.pdf'):
-                full_path = os.path.join(source_dir, file)
-                mod_time = os.path.getmtime(full_path)
-                mod_time_str = datetime.fromtimestamp(mod_time).strftime("%d-%m-%y (%I:%M %p)")
-                file_size = os.path.getsize(full_path) / (1024 * 1024)
-                
-                file_hash = calculate_single_file_hash(full_path)
-                
-                date_range = "Date range not in registry"
-                printed_date = "Not available"
-                import_timestamp = mod_time  # Default to file modification time
-                
-                if file_hash and file_hash in hash_registry:
-                    registry_data = hash_registry[file_hash]
-                    date_range = registry_data.get('date_range', 'Date range not in registry')
-                    printed_date = registry_data.get('printed_date', 'Not available')
-                    # Get import timestamp from registry if available
-                    import_date_str = registry_data.get('import_date', '')
-                    if import_date_str:
-                        try:
-                            import_timestamp = datetime.strptime(import_date_str, "%Y-%m-%d %H:%M:%S").timestamp()
-                        except:
-                            import_timestamp = mod_time
-                else:
-                    date_range, printed_date = extract_dates_from_pdf(full_path)
-                    if file_hash:
-                        save_enhanced_hash_registry(file_hash, file, file_size, "SalesSource", date_range, printed_date)
-                
-                pdf_files.append({
-                    'path': full_path,
-                    'name': file,
-                    'mod_time_str': mod_time_str,
-                    'size_mb': file_size,
-                    'date_range': date_range,
-                    'printed_date': printed_date,
-                    'import_timestamp': import_timestamp  # Add this for sorting
-                })
+            if not file.lower().endswith('.pdf'):
+                continue
+            full_path = os.path.join(source_dir, file)
+            signature, remembered_hash, needs_hash = get_remembered_hash(full_path, registry)
+            mod_time = os.path.getmtime(full_path)
+            
+            pdf_files.append({
+                'path': full_path,
+                'hash': None if needs_hash else remembered_hash,
+                'remembered_hash': remembered_hash,
+                'signature': signature,
+                'name': file,
+                'mod_time_str': datetime.fromtimestamp(mod_time).strftime("%d-%m-%y (%I:%M %p)"),
+                'size_mb': signature[0] / (1024 * 1024),
+                'date_range': "Date range not in registry",
+                'printed_date': "Not available",
+                'import_timestamp': mod_time  # Default to file modification time
+            })
+        
+        # Hash new or changed files in parallel (hashlib releases the GIL)
+        to_hash = [pdf_file for pdf_file in pdf_files if not pdf_file['hash']]
+        if to_hash:
+            with_legacy = registry.has_legacy_hashes()
+            with ProgressBar("Hashing PDF files", total=sum(f['signature'][0] for f in to_hash)) as progress:
+                with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(to_hash))) as pool:
+                    futures = {pool.submit(calculate_file_digests, f['path'], with_legacy): f for f in to_hash}
+                    for future in as_completed(futures):
+                        pdf_file = futures[future]
+                        pdf_file['hash'] = store_file_hash(pdf_file['path'], pdf_file['signature'], future.result(),
+                                                           registry, pdf_file['remembered_hash'])
+                        progress.update(pdf_file['signature'][0])
+        
+        # Registry lookups are indexed - only reports without dates need a header probe
+        to_probe = []
+        for pdf_file in pdf_files:
+            registry_data = registry.lookup(pdf_file['hash'])
+            if registry_data and registry_data['date_range']:
+                pdf_file['date_range'] = registry_data['date_range']
+                pdf_file['printed_date'] = registry_data['printed_date'] or 'Not available'
+                # Get import timestamp from registry if available
+                import_date_str = registry_data.get('import_date', '')
+                if import_date_str:
+                    try:
+                        pdf_file['import_timestamp'] = datetime.strptime(import_date_str, "%Y-%m-%d %H:%M:%S").timestamp()
+                    except:
+                        pass
+            else:
+                to_probe.append(pdf_file)
+        
+        # Probe unknown reports on a bounded pool, showing each one as it arrives
+        if to_probe:
+            # JVM start silences the whole process, so do it before the workers run
+            load_module('tabula_parser').start_jvm()
+            with ProgressBar("Reading new report headers", total=len(to_probe)) as progress:
+                with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(to_probe))) as pool:
+                    futures = {pool.submit(probe_pdf_dates, f['path']): f for f in to_probe}
+                    for future in as_completed(futures):
+                        pdf_file = futures[future]
+                        pdf_file['date_range'], pdf_file['printed_date'] = future.result()
+                        if pdf_file['hash']:
+                            registry.record_dates(pdf_file['hash'], pdf_file['name'], pdf_file['size_mb'],
+                                                  "SalesSource", pdf_file['date_range'], pdf_file['printed_date'])
+                        clear_line()
+                        print(f"{Colors.GREEN}   🆕 {pdf_file['name']} - {pdf_file['date_range']}{Colors.RESET}")
+                        progress.update()
+        
+        registry.prune_stats()
     except Exception as e:
         return []
     
@@ -307,102 +370,335 @@ def select_pdf_file_with_dates():
                 print(f"{Colors.YELLOW}📅 Period: {selected_file['date_range']}{Colors.RESET}")
                 if selected_file['printed_date'] != "Not available":
                     print(f"{Colors.BLUE}🖨️  Printed: {selected_file['printed_date']}{Colors.RESET}")
-                return selected_file['path']
+                return selected_file['path'], selected_file['hash']
             else:
                 print(f"{Colors.RED}❌ Please enter 1-{len(pdf_files)}{Colors.RESET}")
         except ValueError:
             print(f"{Colors.RED}❌ Please enter a valid number{Colors.RESET}")
 
 # Auto-Import Functions
-def scan_downloads_for_pdfs():
-    """Scan downloads for PDF files"""
-    download_folders = [
-        "/storage/emulated/0/Download",
-        "/storage/emulated/0/Downloads", 
-        "/storage/emulated/0/download",
-        "/storage/emulated/0/downloads"
-    ]
-    
-    candidate_pdfs = []
-    
-    for folder in download_folders:
-        if not os.path.exists(folder):
-            continue
-            
+def hash_candidates(candidate_pdfs, registry):
+    """
+    Attach 'hash' to every candidate: remembered hashes are reused, the rest
+    are hashed concurrently. Registry updates stay on this thread.
+    """
+    to_hash = []
+    for candidate in candidate_pdfs:
         try:
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith(('.pdf', '.PDF')):
-                        file_path = os.path.join(root, file)
-                        if not os.path.isfile(file_path):
-                            continue
-                        file_size = os.path.getsize(file_path) / (1024 * 1024)
-                        if 5.0 <= file_size <= 6.0:
-                            creation_time = os.path.getctime(file_path)
-                            candidate_pdfs.append({
-                                'path': file_path,
-                                'name': file,
-                                'size_mb': file_size,
-                                'creation_time': creation_time,
-                                'source_folder': root,
-                                'relative_path': os.path.relpath(file_path, folder) if root != folder else file
-                            })
-        except:
+            signature, remembered_hash, needs_hash = get_remembered_hash(candidate['path'], registry)
+        except OSError:
+            candidate['hash'] = None
             continue
-    
-    return candidate_pdfs
+        candidate['signature'] = signature
+        candidate['remembered_hash'] = remembered_hash
+        candidate['hash'] = None if needs_hash else remembered_hash
+        if needs_hash:
+            to_hash.append(candidate)
+
+    if to_hash:
+        with_legacy = registry.has_legacy_hashes()
+        with ProgressBar("Hashing new downloads", total=sum(c['signature'][0] for c in to_hash)) as progress:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(to_hash))) as pool:
+                futures = {pool.submit(calculate_file_digests, c['path'], with_legacy): c for c in to_hash}
+                for future in as_completed(futures):
+                    candidate = futures[future]
+                    candidate['hash'] = store_file_hash(candidate['path'], candidate['signature'], future.result(),
+                                                        registry, candidate['remembered_hash'])
+                    progress.update(candidate['signature'][0])
 
-def find_latest_pdf_in_downloads(known_hashes):
-    """Find latest PDF in downloads"""
-    candidate_pdfs = scan_downloads_for_pdfs()
+    return [candidate for candidate in candidate_pdfs if candidate['hash']]
+
+def is_in_sales_source(file_hash, file_name, registry):
+    """True if this content (or a file of that name) is already in SalesSource"""
+    if os.path.exists(os.path.join(SALES_SOURCE_DIR, file_name)):
+        return True
+    return any(os.path.dirname(path) == SALES_SOURCE_DIR and os.path.exists(path)
+               for path in registry.paths_for_hash(file_hash))
+
+def find_new_pdfs_in_downloads(registry):
+    """
+    Find every unseen report PDF in downloads (newest first).
+    Identical content under different names is imported once.
+    Returns (new_pdfs, skipped_known, skipped_duplicates)
+    """
+    with ProgressBar("Scanning download directories", unit="files") as progress, profiling.stage('downloads.scan'):
+        candidate_pdfs = downloads_scanner.scan_downloads_for_pdfs(progress=progress)
     
     if not candidate_pdfs:
-        return None
+        return [], 0, 0
     
     candidate_pdfs.sort(key=lambda x: x['creation_time'], reverse=True)
-    latest_pdf = candidate_pdfs[0]
+    candidate_pdfs = hash_candidates(candidate_pdfs, registry)
     
-    file_hash = calculate_single_file_hash(latest_pdf['path'])
-    if not file_hash:
-        return None
+    new_pdfs = []
+    seen_hashes = set()
+    skipped_known = 0
+    skipped_duplicates = 0
     
-    if file_hash in known_hashes:
-        sales_source_path = os.path.join("/storage/emulated/0/SalesSource", latest_pdf['name'])
-        if os.path.exists(sales_source_path):
-            print(f"{Colors.YELLOW}⏭️  Skipping known file: {latest_pdf['name']}{Colors.RESET}")
-            return None
-        else:
-            print(f"{Colors.GREEN}🔄 File was previously processed but deleted, re-importing: {latest_pdf['name']}{Colors.RESET}")
+    for candidate in candidate_pdfs:
+        file_hash = candidate['hash']
+        if file_hash in seen_hashes:
+            skipped_duplicates += 1
+            continue
+        seen_hashes.add(file_hash)
+        
+        if registry.contains(file_hash):
+            if is_in_sales_source(file_hash, candidate['name'], registry):
+                print(f"{Colors.YELLOW}⏭️  Skipping known file: {candidate['name']}{Colors.RESET}")
+                skipped_known += 1
+                continue
+            print(f"{Colors.GREEN}🔄 File was previously processed but deleted, re-importing: {candidate['name']}{Colors.RESET}")
+        
+        new_pdfs.append(candidate)
     
-    latest_pdf['hash'] = file_hash
-    return latest_pdf
+    return new_pdfs, skipped_known, skipped_duplicates
+
+def unique_destination(directory, file_name):
+    """Destination path that never overwrites a different report with the same name"""
+    destination_path = os.path.join(directory, file_name)
+    base_name, extension = os.path.splitext(file_name)
+    counter = 1
+    while os.path.exists(destination_path):
+        destination_path = os.path.join(directory, f"{base_name} ({counter}){extension}")
+        counter += 1
+    return destination_path
 
 def auto_import_pdf_from_downloads():
-    """Auto import PDF from downloads"""
+    """Auto import every new PDF from downloads in one pass"""
     print(f"{Colors.CYAN}🔍 Scanning Download folders for NEW PDF files...{Colors.RESET}")
+    start_time = time.time()
     
-    show_progress("Scanning download directories", 2)
-    
-    known_hashes = load_hash_registry()
-    latest_pdf = find_latest_pdf_in_downloads(known_hashes)
+    registry = hash_registry.get_registry()
+    print(f"{Colors.BLUE}📊 {registry.count()} known PDF hashes in registry{Colors.RESET}")
+    new_pdfs, skipped_known, skipped_duplicates = find_new_pdfs_in_downloads(registry)
     
-    if not latest_pdf:
+    if not new_pdfs:
         print(f"{Colors.GREEN}✅ No new PDFs found (or all files already processed){Colors.RESET}")
-        return None
+        return []
+    
+    imported_paths = []
+    for new_pdf in new_pdfs:
+        print(f"{Colors.GREEN}🎯 Found NEW PDF: {new_pdf['name']}{Colors.RESET}")
+        destination_path = unique_destination(SALES_SOURCE_DIR, new_pdf['name'])
+        
+        try:
+            shutil.move(new_pdf['path'], destination_path)
+            registry.record_import(new_pdf['hash'], os.path.basename(destination_path),
+                                   new_pdf['size_mb'], new_pdf['source_folder'])
+            remember_file_hash(destination_path, new_pdf['hash'], registry)
+            imported_paths.append(destination_path)
+        except Exception as e:
+            print(f"{Colors.RED}❌ Error importing PDF: {new_pdf['name']}{Colors.RESET}")
+    
+    print(f"{Colors.GREEN}✅ Imported {len(imported_paths)} PDF(s) to SalesSource in {time.time() - start_time:.1f}s{Colors.RESET}")
+    if skipped_known or skipped_duplicates:
+        print(f"{Colors.YELLOW}   ⏭️  {skipped_known} already known, {skipped_duplicates} duplicate copies left in Downloads{Colors.RESET}")
     
-    print(f"{Colors.GREEN}🎯 Found NEW PDF: {latest_pdf['name']}{Colors.RESET}")
-    sales_source_dir = "/storage/emulated/0/SalesSource"
-    destination_path = os.path.join(sales_source_dir, latest_pdf['name'])
+    return imported_paths
+
+# Territory / Page Range Selection
+def load_territory_index(pdf_path, pdf_hash):
+    """Territory -> page range map for a report, built once per report hash"""
+    registry = hash_registry.get_registry()
+    entries = registry.get_territory_index(pdf_hash)
+    if entries or not pdf_hash or not territory_index.is_available():
+        return entries
+    
+    with ProgressBar("Indexing territories", unit="pages") as progress, profiling.stage('territory.index'):
+        return territory_index.get_territory_index(pdf_path, pdf_hash, registry, progress)
+
+def show_territory_index(entries):
+    print(f"\n{Colors.GREEN}🗺️  {len(entries)} territories in this report:{Colors.RESET}")
+    width = get_safe_width()
+    cells = [f"{entry['territory']} ({entry['first_page']}-{entry['last_page']})" for entry in entries]
+    cell_width = max(len(cell) for cell in cells) + 3
+    per_row = max(1, width // cell_width)
+    for i in range(0, len(cells), per_row):
+        print("".join(cell.ljust(cell_width) for cell in cells[i:i + per_row]))
+
+def select_page_range(pdf_path, pdf_hash):
+    """Ask for a territory ID or page range; returns (start_page, end_page)"""
+    default_start_page = 339
+    default_end_page = 345
+    
+    entries = load_territory_index(pdf_path, pdf_hash)
+    if entries:
+        show_territory_index(entries)
+        prompt = f"\n{Colors.CYAN}Enter territory ID (e.g., {entries[0]['territory']}), page range (e.g., 110-118) or press Enter for default ({default_start_page}-{default_end_page}): {Colors.RESET}"
+    else:
+        prompt = f"\n{Colors.CYAN}Enter page range (e.g., 110-118) or press Enter for default ({default_start_page}-{default_end_page}): {Colors.RESET}"
+    page_input = input(prompt).strip()
+    
+    if not page_input:
+        print(f"{Colors.GREEN}Using default page range: {default_start_page}-{default_end_page}{Colors.RESET}")
+        return default_start_page, default_end_page
+    
+    # Territory IDs contain '-' too, so try them before parsing a page range
+    entry = territory_index.find_territory(entries, page_input)
+    if entry:
+        print(f"{Colors.GREEN}📍 Territory {entry['territory']} ({entry['group']}): pages {entry['first_page']}-{entry['last_page']}{Colors.RESET}")
+        return entry['first_page'], entry['last_page']
     
     try:
-        import shutil
-        shutil.move(latest_pdf['path'], destination_path)
-        print(f"{Colors.GREEN}✅ Successfully imported to SalesSource{Colors.RESET}")
-        save_to_hash_registry(latest_pdf['hash'], latest_pdf['name'], latest_pdf['size_mb'], latest_pdf['source_folder'])
-        return destination_path
-    except Exception as e:
-        print(f"{Colors.RED}❌ Error importing PDF{Colors.RESET}")
-        return None
+        start_page_str, end_page_str = page_input.split('-')
+        start_page = int(start_page_str.strip())
+        end_page = int(end_page_str.strip())
+        if start_page > end_page:
+            print(f"{Colors.RED}❌ Start page cannot be greater than end page{Colors.RESET}")
+            sys.exit(1)
+    except (ValueError, IndexError):
+        print(f"{Colors.RED}❌ Invalid page range format{Colors.RESET}")
+        sys.exit(1)
+    
+    return start_page, end_page
+
+# Extraction with parsed-result cache
+def text_engine_verified(pdf_path, start_page, end_page, file_hash):
+    """
+    True if the text engine may be used for this page range of the report.
+    The first time a range is requested, a few of its pages are extracted with
+    both engines and compared; the verdict is stored under the report hash and
+    the range, so later runs on the same territory never start the JVM.
+    Without a report hash nothing could be stored, so Tabula is used.
+    """
+    text_engine = load_module('text_engine')
+    if not text_engine.is_available():
+        print(f"{Colors.YELLOW}⚠️  pdftotext not found - using Tabula{Colors.RESET}")
+        return False
+    if not file_hash:
+        print(f"{Colors.YELLOW}⚠️  Report hash unknown - using Tabula{Colors.RESET}")
+        return False
+    
+    registry = hash_registry.get_registry()
+    verdict = registry.get_engine_verdict(file_hash, 'text', start_page, end_page)
+    if verdict is None:
+        sample_start, sample_end = text_engine.sample_range(start_page, end_page)
+        print(f"{Colors.CYAN}🔬 Cross-checking text engine against Tabula on pages {sample_start}-{sample_end}...{Colors.RESET}")
+        try:
+            with profiling.stage('extract.cross_check'):
+                text_result = text_engine.extract_pdf_data_text(pdf_path, (sample_start, sample_end))
+                tabula_result = load_module('tabula_parser').extract_pdf_data_tabula(pdf_path, (sample_start, sample_end))
+                verdict, detail = text_engine.compare_results(text_result, tabula_result)
+        except Exception as e:
+            verdict, detail = 'inconclusive', str(e)
+        
+        if verdict != 'inconclusive':
+            registry.set_engine_verdict(file_hash, 'text', start_page, end_page, verdict, detail)
+        print(f"{Colors.BLUE}🔬 Text engine {verdict}: {detail}{Colors.RESET}")
+    
+    if verdict != 'match':
+        print(f"{Colors.YELLOW}⚠️  Text engine not verified for pages {start_page}-{end_page} - using Tabula{Colors.RESET}")
+        return False
+    return True
+
+def extract_pdf_data(pdf_path, start_page, end_page, file_hash, engine=None):
+    """
+    Extract a page range, reusing the cached result for this PDF hash when available
+    engine: 'tabula' (default) or 'text' (pdftotext, no JVM; only once verified for the report)
+    """
+    result_cache = load_module('result_cache')
+    use_text = (engine or EXTRACTION_ENGINE) == 'text' and text_engine_verified(pdf_path, start_page, end_page, file_hash)
+    
+    if use_text:
+        text_engine = load_module('text_engine')
+        parser_version = f"text-{text_engine.TEXT_ENGINE_VERSION}"
+    else:
+        tabula_parser = load_module('tabula_parser')
+        parser_version = tabula_parser.PARSER_VERSION
+    
+    with profiling.stage('extract.cache_load'):
+        cached = result_cache.load_cached_result(file_hash, start_page, end_page, parser_version)
+    if cached:
+        print(f"{Colors.GREEN}⚡ Loaded cached extraction for pages {start_page}-{end_page}{Colors.RESET}")
+        return cached
+
+    # One step for the header page plus one per table page
+    with ProgressBar("Extracting pages", total=end_page - start_page + 2) as progress, \
+            profiling.stage('extract.text' if use_text else 'extract.tabula'):
+        if use_text:
+            structured_data, zero_value_data, header_data = text_engine.extract_pdf_data_text(
+                pdf_path, (start_page, end_page), progress=progress)
+        else:
+            structured_data, zero_value_data, header_data = tabula_parser.extract_pdf_data_tabula(
+                pdf_path, f"{start_page}-{end_page}", progress=progress)
+
+    if structured_data or zero_value_data:
+        with profiling.stage('extract.cache_save'):
+            result_cache.save_cached_result(file_hash, start_page, end_page, parser_version,
+                                            structured_data, zero_value_data, header_data)
+
+    return structured_data, zero_value_data, header_data
+
+# Batch Mode
+def run_batch_mode(args):
+    """
+    report --batch [pdf_path] [--workers N] [--target-share X]: extract every
+    territory without prompts (the target share comes from the argument or the
+    saved target_share.txt)
+    """
+    workers = None
+    pdf_path = None
+    target_share = None
+    try:
+        for i, arg in enumerate(args):
+            if arg == '--workers':
+                workers = int(args[i + 1])
+            elif arg == '--target-share':
+                target_share = float(args[i + 1])
+                if target_share <= 0:
+                    raise ValueError(arg)
+            elif not arg.startswith('-') and (i == 0 or args[i - 1] not in ('--workers', '--target-share')):
+                pdf_path = os.path.abspath(arg)
+    except (ValueError, IndexError):
+        print(f"{Colors.RED}❌ Usage: report --batch [pdf_path] [--workers N] [--target-share X]{Colors.RESET}")
+        sys.exit(1)
+    
+    print_header("IPL SALES ANALYZER - BATCH MODE")
+    if target_share is None:
+        target_share = load_target_share()
+    if target_share is None:
+        print(f"{Colors.RED}❌ No target share saved - pass --target-share X (e.g. 0.33) "
+              f"or set it once with 'report'{Colors.RESET}")
+        sys.exit(1)
+    if not ensure_directories():
+        print(f"{Colors.RED}❌ Directory setup failed{Colors.RESET}")
+        sys.exit(1)
+    
+    registry = hash_registry.get_registry()
+    if pdf_path:
+        if not os.path.exists(pdf_path):
+            print(f"{Colors.RED}❌ PDF not found: {pdf_path}{Colors.RESET}")
+            sys.exit(1)
+        pdf_hash = get_file_hash(pdf_path, registry)
+    else:
+        pdf_files = find_pdf_files_with_registry_dates()
+        if not pdf_files:
+            print(f"{Colors.RED}❌ No PDF files found in SalesSource directory{Colors.RESET}")
+            sys.exit(1)
+        pdf_path, pdf_hash = pdf_files[0]['path'], pdf_files[0]['hash']
+    
+    print(f"{Colors.GREEN}📄 Report: {os.path.basename(pdf_path)}{Colors.RESET}")
+    entries = load_territory_index(pdf_path, pdf_hash)
+    if not entries:
+        print(f"{Colors.RED}❌ Could not index territories (is pdftotext installed?){Colors.RESET}")
+        sys.exit(1)
+    
+    timestamp = datetime.now().strftime("%H-%M_%d-%m-%y")
+    output_dir = os.path.join(REPORTS_DIR,
+                              f"Batch_{Path(pdf_path).stem}_{timestamp}")
+    
+    start_time = time.time()
+    batch_mode = load_module('batch_mode')
+    parser_version = load_module('tabula_parser').PARSER_VERSION
+    summary = batch_mode.run_batch(pdf_path, pdf_hash, entries, output_dir, target_share,
+                                   workers=workers, parser_version=parser_version)
+    hash_registry.close_registry()
+    
+    failed = [row['territory'] for row in summary if 'error' in row]
+    print(f"{Colors.GREEN}✅ {len(summary) - len(failed)} territories written to: {output_dir}{Colors.RESET}")
+    if failed:
+        print(f"{Colors.RED}❌ {len(failed)} territories failed: {', '.join(failed)}{Colors.RESET}")
+    print(f"{Colors.GREEN}🕒 Completed in {time.time() - start_time:.1f}s{Colors.RESET}")
 
 # Command Functions
 def get_current_version():
@@ -422,6 +718,10 @@ def show_help():
     print(f"  {Colors.GREEN}report -u / --update{Colors.RESET} - Check and install updates")
     print(f"  {Colors.GREEN}report -r / --reinstall{Colors.RESET} - Reinstall application")
     print(f"  {Colors.GREEN}report -v / --version{Colors.RESET} - Show version information")
+    print(f"  {Colors.GREEN}report --verify{Colors.RESET}      - Re-hash every PDF instead of trusting size/date")
+    print(f"  {Colors.GREEN}report --batch [pdf] [--workers N] [--target-share X]{Colors.RESET} - Extract every territory of a report")
+    print(f"  {Colors.GREEN}report --engine text{Colors.RESET} - Read the PDF text layer instead of starting Java (checked against Tabula once per report)")
+    print(f"  {Colors.GREEN}report --profile [cprofile]{Colors.RESET} - Time each stage; saves a JSON trace (and a cProfile dump) to {PROFILES_DIR}")
     print(f"  {Colors.GREEN}report -h / --help{Colors.RESET}   - Show this help message")
     print(f"\n{Colors.BLUE}Repository: https://github.com/5C0R410N/IPL-Sales-Analyzer{Colors.RESET}")
 
@@ -480,7 +780,8 @@ def get_user_data():
         else:
             print(f"{Colors.RED}❌ Please enter both first and last name{Colors.RESET}")
 
-def get_target_share():
+def load_target_share():
+    """Saved target share, or None when the file is missing or invalid"""
     target_file = SCRIPT_DIR / TARGET_SHARE_FILE
     if target_file.exists():
         try:
@@ -490,7 +791,14 @@ def get_target_share():
                     return float(data)
         except:
             pass
+    return None
+
+def get_target_share():
+    target_share = load_target_share()
+    if target_share is not None:
+        return target_share
     
+    target_file = SCRIPT_DIR / TARGET_SHARE_FILE
     print_header("TARGET SHARE SETUP")
     print(f"{Colors.WHITE}Please set your target share for National Average calculation.{Colors.RESET}")
     print(f"{Colors.WHITE}Example: 0.33 for 33% target share{Colors.RESET}")
@@ -530,19 +838,21 @@ def ensure_directories():
                 return False
     return True
 
-def run_command_with_progress(cmd, desc):
-    """Run command with progress display"""
-    print(f"{Colors.CYAN}🕒 {desc}...{Colors.RESET}")
-    show_progress(desc, 3)
-    
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"{Colors.RED}❌ Error in {desc}{Colors.RESET}")
-        sys.exit(1)
-
 # Product Display Functions - MODIFIED FOR TARGET CALCULATIONS
+def format_product_entry(product, total_label="Total Accounted Value (Taka)"):
+    """One product block of the product lists and the report"""
+    return "".join([
+        f"Product Code: {product['code']}\n",
+        f"Brand Name: {product['brand_name']}\n",
+        f"    - Target Quantity: {product['tgt_qty']}\n",
+        f"    - Sold Quantity: {product['sold_qty']}\n",
+        f"    - In Transit Quantity: {product['int_qty']}\n",
+        f"    - Target Value (Taka): {product['tgt_val']:.2f}\n",
+        f"    - Sold Value (Taka): {product['sold_val']:.2f}\n",
+        f"    - In Transit Value (Taka): {product['int_val']:.2f}\n",
+        f"    - {total_label}: {product['total_val']:.2f}\n\n",
+    ])
+
 def display_product_data_list(matching_products, zero_matches, target_share):
     """Display product data with ALL products included in target calculations"""
     all_products = matching_products + zero_matches
@@ -551,80 +861,61 @@ def display_product_data_list(matching_products, zero_matches, target_share):
         print(f"{Colors.YELLOW}No products found matching the criteria.{Colors.RESET}")
         return "", 0.0
     
+    calculator = load_module('calculator')
+    
     # Calculate totals from ALL products for target values
-    totals = calculator.calculate_totals_python(all_products)
+    totals = calculator.calculate_totals(all_products)
     
-    list_content = f"--- Found {len(all_products)} product(s) matching query ---\n"
-    list_content += f"   - {len(matching_products)} with sales activity\n"
-    list_content += f"   - {len(zero_matches)} with zero sales activity\n\n"
-    report_content = list_content
+    # Listing and report share the same text; built with one StringIO instead of +=
+    list_content = io.StringIO()
+    list_content.write(f"--- Found {len(all_products)} product(s) matching query ---\n")
+    list_content.write(f"   - {len(matching_products)} with sales activity\n")
+    list_content.write(f"   - {len(zero_matches)} with zero sales activity\n\n")
 
     # Display active products first
     if matching_products:
-        list_content += f"--- Products WITH Sales Activity ({len(matching_products)}) ---\n\n"
-        report_content += f"--- Products WITH Sales Activity ({len(matching_products)}) ---\n\n"
-        
+        list_content.write(f"--- Products WITH Sales Activity ({len(matching_products)}) ---\n\n")
         for product in matching_products:
-            entry_str = f"Product Code: {product['code']}\n"
-            entry_str += f"Brand Name: {product['brand_name']}\n"
-            entry_str += f"    - Target Quantity: {product['tgt_qty']}\n"
-            entry_str += f"    - Sold Quantity: {product['sold_qty']}\n"
-            entry_str += f"    - In Transit Quantity: {product['int_qty']}\n"
-            entry_str += f"    - Target Value (Taka): {product['tgt_val']:.2f}\n"
-            entry_str += f"    - Sold Value (Taka): {product['sold_val']:.2f}\n"
-            entry_str += f"    - In Transit Value (Taka): {product['int_val']:.2f}\n"
-            entry_str += f"    - Total Accounted Value (Sold + In Transit, Taka): {product['total_val']:.2f}\n\n"
-            list_content += entry_str
-            report_content += entry_str
+            list_content.write(format_product_entry(product, "Total Accounted Value (Sold + In Transit, Taka)"))
     
     # Display zero-sales products
     if zero_matches:
-        list_content += f"--- Products WITH ZERO Sales Activity ({len(zero_matches)}) ---\n\n"
-        report_content += f"--- Products WITH ZERO Sales Activity ({len(zero_matches)}) ---\n\n"
-        
+        list_content.write(f"--- Products WITH ZERO Sales Activity ({len(zero_matches)}) ---\n\n")
         for product in zero_matches:
-            entry_str = f"Product Code: {product['code']}\n"
-            entry_str += f"Brand Name: {product['brand_name']}\n"
-            entry_str += f"    - Target Quantity: {product['tgt_qty']}\n"
-            entry_str += f"    - Sold Quantity: {product['sold_qty']}\n"
-            entry_str += f"    - In Transit Quantity: {product['int_qty']}\n"
-            entry_str += f"    - Target Value (Taka): {product['tgt_val']:.2f}\n"
-            entry_str += f"    - Sold Value (Taka): {product['sold_val']:.2f}\n"
-            entry_str += f"    - In Transit Value (Taka): {product['int_val']:.2f}\n"
-            entry_str += f"    - Total Accounted Value (Taka): {product['total_val']:.2f}\n\n"
-            list_content += entry_str
-            report_content += entry_str
+            list_content.write(format_product_entry(product))
     
+    list_content = list_content.getvalue()
     print(list_content)
     
-    totals_content = f"--- Total for ALL matching products ({len(all_products)} products) ---\n"
-    totals_content += f"    - Total Target Quantity: {totals['total_tgt_qty']}\n"
-    totals_content += f"    - Total Sold Quantity: {totals['total_sold_qty']}\n"
-    totals_content += f"    - Total In Transit Quantity: {totals['total_int_qty']}\n"
-    totals_content += f"    - Total Accounted Quantity: {totals['total_accounted_qty']}\n"
-    totals_content += f"    - Total Target Value (Taka): {totals['total_tgt_val']:.2f}\n"
-    totals_content += f"    - Total Sold Value (Taka): {totals['total_sold_val']:.2f}\n"
-    totals_content += f"    - Total In Transit Value (Taka): {totals['total_int_val']:.2f}\n"
-    totals_content += f"    - Total Accounted Value (Taka): {totals['total_accounted_val']:.2f}\n\n"
+    totals_content = "".join([
+        f"--- Total for ALL matching products ({len(all_products)} products) ---\n",
+        f"    - Total Target Quantity: {totals['total_tgt_qty']}\n",
+        f"    - Total Sold Quantity: {totals['total_sold_qty']}\n",
+        f"    - Total In Transit Quantity: {totals['total_int_qty']}\n",
+        f"    - Total Accounted Quantity: {totals['total_accounted_qty']}\n",
+        f"    - Total Target Value (Taka): {totals['total_tgt_val']:.2f}\n",
+        f"    - Total Sold Value (Taka): {totals['total_sold_val']:.2f}\n",
+        f"    - Total In Transit Value (Taka): {totals['total_int_val']:.2f}\n",
+        f"    - Total Accounted Value (Taka): {totals['total_accounted_val']:.2f}\n\n",
+    ])
     
     print(totals_content)
-    report_content += totals_content
     
-    national_avg_rounded = calculator.calculate_national_average_python(totals['total_accounted_val'], target_share)
+    national_avg_rounded = calculator.calculate_national_average(totals['total_accounted_val'], target_share)
     
     if national_avg_rounded > 0:
-        avg_content = f"--- National Average Calculation ---\n"
-        avg_content += f"    - Total Accounted Value: {totals['total_accounted_val']:.2f} Taka\n"
-        avg_content += f"    - Target Share: {target_share}\n"
-        avg_content += f"    - National Average (Crores): {national_avg_rounded}\n\n"
+        avg_content = "".join([
+            f"--- National Average Calculation ---\n",
+            f"    - Total Accounted Value: {totals['total_accounted_val']:.2f} Taka\n",
+            f"    - Target Share: {target_share}\n",
+            f"    - National Average (Crores): {national_avg_rounded}\n\n",
+        ])
     else:
-        avg_content = f"--- National Average Calculation ---\n"
-        avg_content += f"    - Calculation skipped (insufficient data)\n\n"
+        avg_content = f"--- National Average Calculation ---\n    - Calculation skipped (insufficient data)\n\n"
     
     print(avg_content)
-    report_content += avg_content
     
-    return report_content, national_avg_rounded
+    return "".join([list_content, totals_content, avg_content]), national_avg_rounded
 
 def display_zero_value_products_list(zero_matches):
     if not zero_matches:
@@ -634,25 +925,94 @@ def display_zero_value_products_list(zero_matches):
     message += "All values are zero (no sales activity)\n\n"
     print(message)
     
-    report_content = message
+    report_parts = [message]
     
     for product in zero_matches:
-        entry_str = f"Product Code: {product['code']}\n"
-        entry_str += f"Brand Name: {product['brand_name']}\n"
-        entry_str += f"    - Target Quantity: {product['tgt_qty']}\n"
-        entry_str += f"    - Sold Quantity: {product['sold_qty']}\n"
-        entry_str += f"    - In Transit Quantity: {product['int_qty']}\n"
-        entry_str += f"    - Target Value (Taka): {product['tgt_val']:.2f}\n"
-        entry_str += f"    - Sold Value (Taka): {product['sold_val']:.2f}\n"
-        entry_str += f"    - In Transit Value (Taka): {product['int_val']:.2f}\n"
-        entry_str += f"    - Total Accounted Value (Taka): {product['total_val']:.2f}\n\n"
-        report_content += entry_str
+        entry_str = format_product_entry(product)
+        report_parts.append(entry_str)
         print(entry_str)
     
-    return report_content, 0.0
+    return "".join(report_parts), 0.0
+
+# Interactive search
+def normalize_query(product_query):
+    """Lower-case, single-spaced query; the search and the session cache both use this form"""
+    return ' '.join(product_query.lower().split())
+
+def run_product_query(search_index, product_query, target_share):
+    """
+    Search the index, display the matches with totals and national average
+    Returns {'result_count', 'report_content', 'national_avg', 'suggestions'}
+    """
+    # Search products - get ALL matching products (active + zero-sales)
+    with profiling.stage('search.query'):
+        matching_products, zero_matches = search_index.search(product_query)
+    ranked_suggestions = []
+    
+    if matching_products or zero_matches:
+        # Use MODIFIED function that includes ALL products in target calculations
+        with profiling.stage('search.display'):
+            report_section, avg_val = display_product_data_list(matching_products, zero_matches, target_share)
+    else:
+        print(f"{Colors.RED}❌ No products found matching '{product_query}'{Colors.RESET}")
+        report_section = f"No products found matching '{product_query}'.\n"
+        avg_val = 0.0
+        
+        # Typo-tolerant suggestions from the index
+        with profiling.stage('search.suggest'):
+            ranked_suggestions = search_index.suggest(product_query)
+    
+    return {
+        'result_count': len(matching_products) + len(zero_matches),
+        'report_content': report_section,
+        'national_avg': avg_val,
+        'suggestions': ranked_suggestions
+    }
+
+# Profiling (report --profile)
+def finish_profile():
+    """Print the per-stage breakdown and save the JSON trace (and cProfile dump) at exit"""
+    profiler = profiling.get_profiler()
+    if profiler is None:
+        return
+    wall_time = profiler.stop()
+    
+    print_header("PROFILE")
+    for line in profiler.format_summary(wall_time):
+        print(f"{Colors.WHITE}{line}{Colors.RESET}")
+    
+    stamp = datetime.fromtimestamp(profiler.started_at).strftime('%Y-%m-%d_%H-%M-%S')
+    try:
+        trace_path = profiler.write_trace(os.path.join(PROFILES_DIR, f"profile_{stamp}.json"), wall_time)
+        print(f"{Colors.GREEN}📈 Trace saved: {trace_path}{Colors.RESET}")
+        dump_path = profiler.dump_cprofile(os.path.join(PROFILES_DIR, f"profile_{stamp}.prof"))
+        if dump_path:
+            print(f"{Colors.GREEN}📈 cProfile dump saved: {dump_path}{Colors.RESET}")
+    except Exception as e:
+        print(f"{Colors.RED}❌ Could not save profile: {e}{Colors.RESET}")
 
 # MAIN FUNCTION
 def main():
+    global FORCE_HASH_VERIFY, EXTRACTION_ENGINE
+    
+    # --profile [cprofile] can go anywhere on the command line
+    if '--profile' in sys.argv:
+        position = sys.argv.index('--profile')
+        use_cprofile = sys.argv[position + 1:position + 2] == ['cprofile']
+        profiling.enable(use_cprofile)
+        atexit.register(finish_profile)
+        del sys.argv[position:position + (2 if use_cprofile else 1)]
+    
+    # --engine can go anywhere on the command line
+    if '--engine' in sys.argv:
+        position = sys.argv.index('--engine')
+        engine = sys.argv[position + 1].lower() if position + 1 < len(sys.argv) else ''
+        if engine not in EXTRACTION_ENGINES:
+            print(f"{Colors.RED}❌ Usage: report --engine {'|'.join(EXTRACTION_ENGINES)}{Colors.RESET}")
+            sys.exit(1)
+        EXTRACTION_ENGINE = engine
+        del sys.argv[position:position + 2]
+    
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
         if arg in ['-u', '--update']:
@@ -669,6 +1029,11 @@ def main():
         elif arg in ['-v', '--version']:
             show_version()
             return
+        elif arg == '--verify':
+            FORCE_HASH_VERIFY = True
+        elif arg == '--batch':
+            run_batch_mode(sys.argv[2:])
+            return
     
     # Initial setup
     print_header("IPL SALES ANALYZER")
@@ -688,50 +1053,24 @@ def main():
     
     # AUTO-IMPORT
     print_header("AUTOMATIC PDF IMPORT SYSTEM")
-    imported_pdf = auto_import_pdf_from_downloads()
+    imported_pdfs = auto_import_pdf_from_downloads()
     
     # FILE SELECTION
-    pdf_path = select_pdf_file_with_dates()
+    pdf_path, pdf_hash = select_pdf_file_with_dates()
     
-    # Get page range
-    default_start_page = 339
-    default_end_page = 345
-    page_input = input(f"\n{Colors.CYAN}Enter page range (e.g., 110-118) or press Enter for default ({default_start_page}-{default_end_page}): {Colors.RESET}").strip()
-    
-    if not page_input:
-        print(f"{Colors.GREEN}Using default page range: {default_start_page}-{default_end_page}{Colors.RESET}")
-        start_page = default_start_page
-        end_page = default_end_page
-    else:
-        try:
-            start_page_str, end_page_str = page_input.split('-')
-            start_page = int(start_page_str.strip())
-            end_page = int(end_page_str.strip())
-            if start_page > end_page:
-                print(f"{Colors.RED}❌ Start page cannot be greater than end page{Colors.RESET}")
-                sys.exit(1)
-        except (ValueError, IndexError):
-            print(f"{Colors.RED}❌ Invalid page range format{Colors.RESET}")
-            sys.exit(1)
+    # Get page range (territory index lets the user pick a territory instead)
+    start_page, end_page = select_page_range(pdf_path, pdf_hash)
     
     print(f"{Colors.BLUE}📄 Page range: {start_page} - {end_page}{Colors.RESET}")
     
-    # PROCESS PDF WITH TABULA - USING CUT PDF
-    temp_pdf_name = f"temp_extracted_pages_{start_page}_to_{end_page}.pdf"
-    
-    # Extract pages (creates the CUT PDF)
-    pdftk_cmd = f'pdftk "{pdf_path}" cat {start_page}-{end_page} output "{temp_pdf_name}"'
-    run_command_with_progress(pdftk_cmd, "Extracting pages")
-    
-    # PROCESS WITH TABULA USING CUT PDF
+    # PROCESS WITH TABULA - PAGES ARE READ STRAIGHT FROM THE ORIGINAL PDF
     print_header("PROCESSING PDF x MASUD ")
     
     print(f"{Colors.CYAN}🔍 Analyzing PDF with hybrid method...{Colors.RESET}")
-    show_progress("Extracting header information", 2)
     
     try:
-        # USE TABULA PARSER ON CUT PDF
-        structured_data, zero_value_data, header_data = tabula_parser.extract_pdf_data_tabula(temp_pdf_name, f"{start_page}-{end_page}")
+        # USE TABULA PARSER ON THE REQUESTED PAGE RANGE (OR THE CACHED RESULT)
+        structured_data, zero_value_data, header_data = extract_pdf_data(pdf_path, start_page, end_page, pdf_hash)
         
         # Get territory and date from header
         selected_territory = header_data.get('territory_id', 'Unknown_Territory')
@@ -759,12 +1098,41 @@ def main():
     print(f"{Colors.WHITE}Type product names to search (e.g., 'montair', 'moxquin'){Colors.RESET}")
     print(f"{Colors.WHITE}Type 'quit' to exit and generate report{Colors.RESET}")
     
-    session_log = []
+    # Brand-name index built once; every query below is an index lookup
+    search_module = load_module('search_index')
+    with profiling.stage('search.index'):
+        search_index = search_module.SearchIndex(structured_data + zero_value_data)
+    
+    # Each query's section is appended to the report as soon as it is shown
+    report_time = datetime.now()
+    safe_territory = selected_territory.replace(' ', '_').replace('-', '_')
+    report_filename = f"{safe_territory}_Report_{report_time.strftime('%H-%M_%d-%m-%y')}.txt"
+    report_path = os.path.join(REPORTS_DIR, report_filename)
+    report_sink = ReportSink(report_path, [
+        "--- IPL SALES ANALYSIS REPORT ---",
+        "",
+        f"Analyst: {user_name}",
+        f"Territory: {selected_territory}",
+        f"PDF: {os.path.basename(pdf_path)}",
+        f"Pages: {start_page} - {end_page}",
+        f"Date Range: {doc_date_range}",
+        f"Target Share: {target_share}",
+        f"Time: {report_time.strftime('%Y-%m-%d %I:%M:%S %p')}",
+    ])
+    
+    query_cache = {}
+    suggestions = []
     
     while True:
         print_section(f"Search in {selected_territory}")
         product_query = input(f"\n{Colors.CYAN}🔍 Enter product name to search: {Colors.RESET}").strip().lower()
         
+        # A number right after "Did you mean" picks that suggestion
+        if suggestions and product_query.isdigit() and 1 <= int(product_query) <= len(suggestions):
+            product_query = suggestions[int(product_query) - 1]
+            print(f"{Colors.CYAN}🔍 Searching '{product_query}'{Colors.RESET}")
+        suggestions = []
+        
         if product_query == 'quit':
             print(f"{Colors.GREEN}👋 Exiting search...{Colors.RESET}")
             break
@@ -773,71 +1141,47 @@ def main():
             print(f"{Colors.RED}❌ Please enter a product name{Colors.RESET}")
             continue
         
-        # Search products - get ALL matching products (active + zero-sales)
-        matching_products, zero_matches = calculator.search_products_python(structured_data + zero_value_data, product_query)
-        
-        if matching_products or zero_matches:
-            # Use MODIFIED function that includes ALL products in target calculations
-            report_section, avg_val = display_product_data_list(matching_products, zero_matches, target_share)
+        # Repeated queries reuse the result and totals computed the first time
+        cache_key = (normalize_query(product_query), target_share)
+        query_result = query_cache.get(cache_key)
+        if query_result:
+            print(f"{Colors.GREEN}⚡ Same result as before for '{product_query}'{Colors.RESET}")
+            print(query_result['report_content'])
         else:
-            print(f"{Colors.RED}❌ No products found matching '{product_query}'{Colors.RESET}")
-            report_section = f"No products found matching '{product_query}'.\n"
-            avg_val = 0.0
+            query_result = run_product_query(search_index, cache_key[0], target_share)
+            query_cache[cache_key] = query_result
         
-        session_log.append({
-            'query': product_query,
-            'result_count': len(matching_products) + len(zero_matches),
-            'report_content': report_section,
-            'national_avg': avg_val
-        })
-    
-    # Generate final report
-    if session_log:
-        print_header("GENERATING FINAL REPORT")
+        if query_result['suggestions']:
+            print(f"{Colors.YELLOW}💡 Did you mean:{Colors.RESET}")
+            for number, (suggestion, match_count) in enumerate(query_result['suggestions'], 1):
+                print(f"{Colors.WHITE}   {number}. {suggestion} ({match_count} product(s)){Colors.RESET}")
+            print(f"{Colors.WHITE}   Type a number to search it{Colors.RESET}")
+            suggestions = [suggestion for suggestion, _ in query_result['suggestions']]
         
-        show_progress("Generating analysis report", 2)
-        
-        current_time = datetime.now()
-        timestamp = current_time.strftime("%H-%M_%d-%m-%y")
-        safe_territory = selected_territory.replace(' ', '_').replace('-', '_')
-        report_filename = f"{safe_territory}_Report_{timestamp}.txt"
-        reports_dir = "/storage/emulated/0/Analytics_Reports"
-        report_path = os.path.join(reports_dir, report_filename)
-        
-        full_report = "--- IPL SALES ANALYSIS REPORT ---\n\n"
-        full_report += f"Analyst: {user_name}\n"
-        full_report += f"Territory: {selected_territory}\n"
-        full_report += f"PDF: {os.path.basename(pdf_path)}\n"
-        full_report += f"Pages: {start_page} - {end_page}\n"
-        full_report += f"Date Range: {doc_date_range}\n"
-        full_report += f"Target Share: {target_share}\n"
-        full_report += f"Time: {current_time.strftime('%Y-%m-%d %I:%M:%S %p')}\n\n"
-        
-        for log_entry in session_log:
-            full_report += f"QUERY: '{log_entry['query']}'\n"
-            full_report += f"Matches: {log_entry['result_count']} total\n"
-            full_report += log_entry['report_content']
-            if log_entry['national_avg'] > 0:
-                full_report += f"National Average: {log_entry['national_avg']:.2f} Crores\n"
-            full_report += "-" * 40 + "\n\n"
-        
-        try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(full_report)
+        was_failing = report_sink.error is not None
+        with profiling.stage('report.write'):
+            written = report_sink.write_section(product_query, query_result['result_count'],
+                                                query_result['report_content'], query_result['national_avg'])
+        if not written and not was_failing:
+            print(f"{Colors.RED}❌ Error saving report - results are still shown{Colors.RESET}")
+    
+    # Finish the report (sections are already on disk)
+    if report_sink.sections_written:
+        print_header("GENERATING FINAL REPORT")
+        with profiling.stage('report.close'):
+            report_saved = report_sink.close()
+        if report_saved:
             print(f"{Colors.GREEN}✅ Report saved: {report_path}{Colors.RESET}")
-        except Exception as e:
+        else:
             print(f"{Colors.RED}❌ Error saving report{Colors.RESET}")
     else:
         print(f"{Colors.YELLOW}❌ No searches performed{Colors.RESET}")
     
     # Cleanup
     print(f"\n{Colors.CYAN}🧹 Cleaning up...{Colors.RESET}")
-    if os.path.exists(temp_pdf_name):
-        try:
-            os.remove(temp_pdf_name)
-            print(f"{Colors.GREEN}✅ Deleted: {temp_pdf_name}{Colors.RESET}")
-        except:
-            pass
+    if 'tabula_parser' in sys.modules:
+        sys.modules['tabula_parser'].close_session()
+    hash_registry.close_registry()
     
     # Show useful commands
     print_header("USEFUL COMMANDS")
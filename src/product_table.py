@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Columnar Product Store
+Products of a page range held as NumPy columns instead of a list of dicts
+"""
+
+import sys
+import numpy as np
+
+QTY_FIELDS = ('tgt_qty', 'sold_qty', 'int_qty')
+VALUE_FIELDS = ('tgt_val', 'sold_val', 'int_val', 'total_val')
+NUMERIC_FIELDS = QTY_FIELDS + VALUE_FIELDS
+TEXT_FIELDS = ('code', 'brand_name', 'territory')
+# Key order of the product dicts
+PRODUCT_FIELDS = ('code', 'brand_name') + NUMERIC_FIELDS + ('territory',)
+
+# DataFrame column (create_final_dataframe) -> product field
+DATAFRAME_COLUMNS = {
+    'Code': 'code', 'Brand_Name': 'brand_name',
+    'Tgt_Qty': 'tgt_qty', 'Sold_Qty': 'sold_qty', 'Int_Qty': 'int_qty',
+    'Tgt_Value': 'tgt_val', 'Sold_Value': 'sold_val', 'Int_Value': 'int_val', 'Total_Value': 'total_val',
+}
+
+def _text_column(values):
+    """Object array of interned strings (repeated codes/territories share one object)"""
+    return np.array([sys.intern(str(value)) for value in values], dtype=object)
+
+class ProductTable:
+    """
+    Products as columns: interned code/brand/territory strings, int64 quantities,
+    float64 values and a precomputed activity mask.
+    Iterating yields the same product dicts the rest of the app always used,
+    so display and report code works unchanged.
+    """
+
+    __slots__ = TEXT_FIELDS + NUMERIC_FIELDS + ('active', 'brand_lower')
+
+    def __init__(self, columns):
+        for field in TEXT_FIELDS:
+            setattr(self, field, columns[field])
+        for field in QTY_FIELDS:
+            setattr(self, field, np.asarray(columns[field], dtype=np.int64))
+        for field in VALUE_FIELDS:
+            setattr(self, field, np.asarray(columns[field], dtype=np.float64))
+
+        self.active = columns.get('active')
+        if self.active is None:
+            self.active = ((self.sold_qty > 0) | (self.int_qty > 0) | (self.sold_val > 0) |
+                           (self.int_val > 0) | (self.total_val > 0))
+        self.brand_lower = columns.get('brand_lower')
+        if self.brand_lower is None:
+            self.brand_lower = np.array([name.lower() for name in self.brand_name], dtype=object)
+
+    # Construction
+    @classmethod
+    def empty(cls):
+        return cls.from_dicts([])
+
+    @classmethod
+    def from_dataframe(cls, table_data, territory='Unknown'):
+        """Build from the DataFrame returned by create_final_dataframe"""
+        columns = {field: table_data[column].to_numpy() for column, field in DATAFRAME_COLUMNS.items()}
+        columns['code'] = _text_column(columns['code'])
+        columns['brand_name'] = _text_column(columns['brand_name'])
+        columns['territory'] = _text_column([territory] * len(table_data))
+        for field in QTY_FIELDS:
+            # Same truncation as int(value)
+            columns[field] = columns[field].astype(np.float64).astype(np.int64)
+        return cls(columns)
+
+    @classmethod
+    def from_dicts(cls, products):
+        """Build from product dicts (e.g. a cached result)"""
+        products = list(products)
+        columns = {field: _text_column([product.get(field, 'Unknown') for product in products])
+                   for field in TEXT_FIELDS}
+        for field in NUMERIC_FIELDS:
+            columns[field] = [product[field] for product in products]
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables):
+        tables = [table if isinstance(table, ProductTable) else cls.from_dicts(table) for table in tables]
+        if not tables:
+            return cls.empty()
+        return cls({field: np.concatenate([getattr(table, field) for table in tables])
+                    for field in cls.__slots__})
+
+    # Row access
+    def __len__(self):
+        return len(self.code)
+
+    def __iter__(self):
+        columns = [getattr(self, field).tolist() for field in PRODUCT_FIELDS]
+        for values in zip(*columns):
+            yield dict(zip(PRODUCT_FIELDS, values))
+
+    def __getitem__(self, key):
+        """Integer -> product dict; slice / mask / index array -> ProductTable"""
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(key))
+        return self.take(key)
+
+    def __add__(self, other):
+        return ProductTable.concat([self, other])
+
+    def __radd__(self, other):
+        return ProductTable.concat([other, self])
+
+    def row(self, index):
+        return {field: getattr(self, field)[index].item() if field in NUMERIC_FIELDS else getattr(self, field)[index]
+                for field in PRODUCT_FIELDS}
+
+    def take(self, selector):
+        """Subset by boolean mask, index array or slice"""
+        return ProductTable({field: getattr(self, field)[selector] for field in self.__slots__})
+
+    def to_dicts(self):
+        return list(self)
+
+    # Calculations over whole columns
+    def split_by_activity(self):
+        """(active products, zero-activity products)"""
+        return self.take(self.active), self.take(~self.active)
+
+    def search(self, search_query):
+        """Brand-name substring search: (active matches, zero-activity matches)"""
+        query_lower = search_query.lower()
+        matches = np.fromiter((query_lower in name for name in self.brand_lower), dtype=bool, count=len(self))
+        return self.take(matches & self.active), self.take(matches & ~self.active)
+
+    def totals(self):
+        """Same totals as calculate_totals_python: targets from all products, the rest from active ones"""
+        active = self.active
+        total_sold_val = float(self.sold_val[active].sum())
+        total_int_val = float(self.int_val[active].sum())
+        total_accounted_val = float(self.total_val[active].sum())
+        total_sold_qty = float(self.sold_qty[active].sum())
+        total_int_qty = float(self.int_qty[active].sum())
+
+        # Verify and correct accounted value if needed
+        calculated_accounted_val = total_sold_val + total_int_val
+        if abs(total_accounted_val - calculated_accounted_val) > 0.01:
+            total_accounted_val = calculated_accounted_val
+
+        return {
+            'total_tgt_qty': float(self.tgt_qty.sum()),
+            'total_sold_qty': total_sold_qty,
+            'total_int_qty': total_int_qty,
+            'total_tgt_val': float(self.tgt_val.sum()),
+            'total_sold_val': total_sold_val,
+            'total_int_val': total_int_val,
+            'total_accounted_val': total_accounted_val,
+            'total_accounted_qty': total_sold_qty + total_int_qty
+        }
+
+    def verify_consistency(self):
+        """Copy with total_val replaced by sold_val + int_val where they disagree by more than 0.01"""
+        calculated_total = self.sold_val + self.int_val
+        columns = {field: getattr(self, field) for field in self.__slots__}
+        columns['total_val'] = np.where(np.abs(self.total_val - calculated_total) > 0.01,
+                                        calculated_total, self.total_val)
+        columns['active'] = None
+        return ProductTable(columns)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Stage Profiling
+Wall-clock timers and counters around the pipeline stages (report --profile).
+Off by default: stage() then returns a shared no-op context manager, so the
+instrumented code costs one function call per stage.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import nullcontext
+
+TRACE_FORMAT_VERSION = 1
+
+class _Stage:
+    """Context manager timing one run of a stage"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+
+class Profiler:
+    """
+    One event per timed stage (name, start, duration, thread) plus named counters.
+    summary() aggregates the events per stage; write_trace() saves them as a
+    Chrome trace (chrome://tracing, ui.perfetto.dev) with the summary alongside,
+    so runs can be compared across releases and devices.
+    """
+
+    def __init__(self, use_cprofile=False):
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.events = []
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._cprofile = None
+        if use_cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def record(self, name, start, duration):
+        with self._lock:
+            self.events.append((name, start - self.started, duration, threading.get_ident()))
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stop(self):
+        """Stop cProfile (if running); returns the wall time so far"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        return time.perf_counter() - self.started
+
+    def summary(self):
+        """[{'stage', 'calls', 'total', 'mean', 'max'}] in order of first start (seconds)"""
+        stages = {}
+        for name, _, duration, _ in sorted(self.events, key=lambda event: event[1]):
+            entry = stages.setdefault(name, {'stage': name, 'calls': 0, 'total': 0.0, 'max': 0.0})
+            entry['calls'] += 1
+            entry['total'] += duration
+            entry['max'] = max(entry['max'], duration)
+        for entry in stages.values():
+            entry['mean'] = entry['total'] / entry['calls']
+        return list(stages.values())
+
+    def format_summary(self, wall_time=None):
+        """Per-stage breakdown as printable lines"""
+        wall_time = wall_time or (time.perf_counter() - self.started)
+        lines = [f"{'Stage':<24} {'Calls':>6} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9} {'% run':>6}"]
+        for entry in self.summary():
+            lines.append(f"{entry['stage']:<24} {entry['calls']:>6} {entry['total']:>9.3f} "
+                         f"{entry['mean'] * 1000:>9.1f} {entry['max'] * 1000:>9.1f} "
+                         f"{100 * entry['total'] / wall_time:>5.1f}%")
+        lines.append(f"{'run (wall)':<24} {'':>6} {wall_time:>9.3f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<24} {value:>6}")
+        return lines
+
+    def write_trace(self, path, wall_time=None):
+        """JSON trace: Chrome 'X' events (microseconds) plus the summary and counters"""
+        wall_time = wall_time or (time.perf_counter() - self.started)
+        trace = {
+            'format_version': TRACE_FORMAT_VERSION,
+            'started_at': self.started_at,
+            'wall_time': wall_time,
+            'stages': self.summary(),
+            'counters': dict(self.counters),
+            'traceEvents': [
+                {'name': name, 'ph': 'X', 'ts': round(start * 1e6), 'dur': round(duration * 1e6),
+                 'pid': os.getpid(), 'tid': thread}
+                for name, start, duration, thread in self.events
+            ],
+        }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=1)
+        return path
+
+    def dump_cprofile(self, path):
+        """Write the cProfile stats (pstats format); None when cProfile wasn't enabled"""
+        if self._cprofile is None:
+            return None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._cprofile.dump_stats(path)
+        return path
+
+# Process-wide profiler, created by enable()
+_profiler = None
+_NO_STAGE = nullcontext()
+
+def enable(use_cprofile=False):
+    """Start profiling this run"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(use_cprofile)
+    return _profiler
+
+def get_profiler():
+    """The active Profiler, or None when profiling is off"""
+    return _profiler
+
+def stage(name):
+    """with profiling.stage('tabula.header'): ... - times the block when profiling is on"""
+    return _profiler.stage(name) if _profiler is not None else _NO_STAGE
+
+def count(name, amount=1):
+    """Add to a named counter (pages, rows, products, ...) when profiling is on"""
+    if _profiler is not None:
+        _profiler.count(name, amount)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Streaming Report Writer
+Appends each query's section to the report file as soon as it is produced
+"""
+
+import os
+
+WRITE_BUFFER_SIZE = 64 * 1024
+SECTION_RULE = "-" * 40
+
+class ReportSink:
+    """
+    Report file written section by section.
+    The file is created on the first section (no searches -> no report),
+    writes are buffered, and every checkpoint_every sections the buffer is
+    flushed and fsync'ed, so an interrupted session keeps everything up to
+    the last checkpoint.
+    """
+
+    def __init__(self, report_path, header_lines, checkpoint_every=1):
+        self.report_path = report_path
+        self.header_lines = header_lines
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.sections_written = 0
+        self.error = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.report_path) or '.', exist_ok=True)
+        self._file = open(self.report_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        self._file.write("\n".join(self.header_lines) + "\n\n")
+
+    def write_section(self, query, result_count, report_content, national_avg):
+        """Append one query's results; returns False once writing has failed"""
+        if self.error:
+            return False
+        try:
+            if self._file is None:
+                self._open()
+
+            parts = [f"QUERY: '{query}'\n", f"Matches: {result_count} total\n", report_content]
+            if national_avg > 0:
+                parts.append(f"National Average: {national_avg:.2f} Crores\n")
+            parts.append(SECTION_RULE + "\n\n")
+            self._file.write("".join(parts))
+
+            self.sections_written += 1
+            if self.sections_written % self.checkpoint_every == 0:
+                self.checkpoint()
+            return True
+        except Exception as e:
+            self.error = e
+            return False
+
+    def checkpoint(self):
+        """Flush buffered sections and fsync them to storage"""
+        if self._file is None or self.error:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            self.error = e
+
+    def close(self):
+        """Final checkpoint and close; True if a complete report is on disk"""
+        if self._file is None:
+            return False
+        self.checkpoint()
+        try:
+            self._file.close()
+        except Exception as e:
+            self.error = self.error or e
+        self._file = None
+        return self.error is None
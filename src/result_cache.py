@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Parsed Result Cache
+Stores extracted product data on disk keyed by PDF hash and page range
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+from product_table import ProductTable
+
+CACHE_DIR = Path(__file__).parent / "parse_cache"
+MAX_CACHE_BYTES = 20 * 1024 * 1024  # ~20 MB on disk before LRU eviction
+
+def make_cache_key(file_hash, start_page, end_page, parser_version):
+    """Build the cache key for one extraction"""
+    return f"{file_hash}_{start_page}_{end_page}_v{parser_version}"
+
+def _cache_path(cache_key):
+    return CACHE_DIR / f"{cache_key}.json"
+
+def load_cached_result(file_hash, start_page, end_page, parser_version):
+    """
+    Load a cached extraction
+    Returns (structured_data, zero_value_data, header_data) or None on a miss
+    """
+    if not file_hash:
+        return None
+
+    cache_file = _cache_path(make_cache_key(file_hash, start_page, end_page, parser_version))
+    if not cache_file.exists():
+        return None
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+
+        # Touch the entry so eviction drops the least recently used first
+        os.utime(cache_file, None)
+
+        return (ProductTable.from_dicts(cached['structured_data']),
+                ProductTable.from_dicts(cached['zero_value_data']),
+                cached['header_data'])
+    except Exception:
+        # Corrupt or partial entry - drop it and re-extract
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+        return None
+
+def save_cached_result(file_hash, start_page, end_page, parser_version,
+                       structured_data, zero_value_data, header_data):
+    """Save an extraction result, then evict old entries if over budget"""
+    if not file_hash:
+        return False
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file = _cache_path(make_cache_key(file_hash, start_page, end_page, parser_version))
+        payload = {
+            # Product dicts, whether given a ProductTable or a plain list
+            'structured_data': list(structured_data),
+            'zero_value_data': list(zero_value_data),
+            'header_data': header_data,
+        }
+
+        # Write to a temp file first so an interrupted run never leaves half an entry
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, cache_file)
+
+        evict_cache()
+        return True
+    except Exception:
+        return False
+
+def evict_cache(max_bytes=MAX_CACHE_BYTES):
+    """Remove least recently used entries until the cache fits in max_bytes"""
+    if not CACHE_DIR.exists():
+        return 0
+
+    entries = []
+    total_bytes = 0
+    for entry in os.scandir(CACHE_DIR):
+        if entry.is_file() and entry.name.endswith('.json'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes += stat.st_size
+
+    removed = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total_bytes <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_bytes -= size
+            removed += 1
+        except OSError:
+            pass
+
+    return removed
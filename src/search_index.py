@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Product Search Index
+Built once after extraction; brand-name lookups go through pre-lowered names,
+a token/prefix index and a trigram index instead of scanning every product
+"""
+
+import re
+import bisect
+import itertools
+
+import numpy as np
+
+from product_table import ProductTable
+
+NGRAM_SIZE = 3
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Fuzzy suggestions: only the best trigram candidates are scored by edit distance
+MIN_FUZZY_TOKEN_LENGTH = 3
+MAX_FUZZY_CANDIDATES = 64
+MAX_TOKEN_ALTERNATIVES = 3
+MAX_SUGGESTIONS = 5
+
+def ngrams(text, size=NGRAM_SIZE):
+    """Distinct n-grams of text (empty when text is shorter than size)"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def max_edit_distance(token):
+    """Typos tolerated for a word of this length"""
+    if len(token) <= 4:
+        return 1
+    if len(token) <= 8:
+        return 2
+    return 3
+
+def bounded_edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent swaps, the
+    commonest phone-keyboard typo), or None as soon as it must exceed max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return None
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else None
+
+class SearchIndex:
+    """
+    Brand-name search over one or more ProductTables.
+    search() has exactly the semantics of search_products_python
+    (case-insensitive substring, products in their original order),
+    but only the products sharing every trigram of the query are checked.
+    """
+
+    def __init__(self, products=None):
+        self.products = ProductTable.empty()
+        self.names = []            # pre-lowered brand names, by row
+        self.trigrams = {}         # trigram -> [row, ...] (ascending)
+        self.tokens = {}           # token -> [row, ...] (ascending)
+        self.sorted_tokens = []    # for prefix lookups with bisect
+        self.token_trigrams = {}   # padded-token trigram -> [token, ...] (fuzzy candidates)
+        if products is not None:
+            self.add(products)
+
+    def __len__(self):
+        return len(self.products)
+
+    def add(self, products):
+        """Index more products (e.g. another territory or report) after the existing ones"""
+        if not isinstance(products, ProductTable):
+            products = ProductTable.from_dicts(products)
+        offset = len(self.products)
+        self.products = self.products + products
+
+        for row, name in enumerate(products.brand_lower.tolist(), start=offset):
+            self.names.append(name)
+            for gram in ngrams(name):
+                self.trigrams.setdefault(gram, []).append(row)
+            for token in set(TOKEN_PATTERN.findall(name)):
+                if token not in self.tokens:
+                    self.tokens[token] = []
+                    for gram in ngrams(f" {token} "):
+                        self.token_trigrams.setdefault(gram, []).append(token)
+                self.tokens[token].append(row)
+
+        self.sorted_tokens = sorted(self.tokens)
+        return self
+
+    # Lookups returning row numbers
+    def candidate_rows(self, query_lower):
+        """Rows containing every trigram of the query (a superset of the substring matches)"""
+        grams = ngrams(query_lower)
+        if not grams:
+            return range(len(self.names))
+
+        postings = sorted((self.trigrams.get(gram, ()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return sorted(candidates)
+
+    def matching_rows(self, search_query):
+        """Rows whose brand name contains the query (case-insensitive), in original order"""
+        query_lower = search_query.lower()
+        names = self.names
+        return [row for row in self.candidate_rows(query_lower) if query_lower in names[row]]
+
+    def tokens_with_prefix(self, prefix):
+        """Indexed name tokens starting with prefix"""
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.sorted_tokens, prefix)
+        end = bisect.bisect_left(self.sorted_tokens, prefix + '\uffff')
+        return self.sorted_tokens[start:end]
+
+    # Product results
+    def search(self, search_query):
+        """
+        Search products by brand name
+        Returns (matching_products, zero_matches) like search_products_python
+        """
+        rows = np.array(self.matching_rows(search_query), dtype=np.intp)
+        matches = self.products.take(rows)
+        return matches.take(matches.active), matches.take(~matches.active)
+
+    # Typo-tolerant suggestions
+    def similar_tokens(self, token):
+        """
+        Indexed tokens within max_edit_distance(token) of token, closest first:
+        [(token, distance)]. Only tokens sharing the most trigrams are scored.
+        """
+        if len(token) < MIN_FUZZY_TOKEN_LENGTH:
+            return []
+        max_distance = max_edit_distance(token)
+
+        shared = {}
+        for gram in ngrams(f" {token} "):
+            for candidate in self.token_trigrams.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        candidates = sorted(shared, key=lambda candidate: -shared[candidate])[:MAX_FUZZY_CANDIDATES]
+
+        similar = []
+        for candidate in candidates:
+            distance = bounded_edit_distance(token, candidate, max_distance)
+            if distance is not None:
+                similar.append((distance, -shared[candidate], candidate))
+        return [(candidate, distance) for distance, _, candidate in sorted(similar)]
+
+    def suggest(self, search_query, limit=MAX_SUGGESTIONS):
+        """
+        Ranked corrections for a query that matched nothing: [(suggested_query, match_count)].
+        Unknown words of the query are swapped for close indexed words; a
+        correction is only suggested if it actually finds products.
+        """
+        query_lower = search_query.lower().strip()
+        query_tokens = TOKEN_PATTERN.findall(query_lower)
+        if not query_tokens:
+            return []
+
+        alternatives = []
+        for token in query_tokens:
+            if token in self.tokens or self.tokens_with_prefix(token):
+                alternatives.append([(token, 0)])
+            else:
+                alternatives.append(self.similar_tokens(token)[:MAX_TOKEN_ALTERNATIVES] or [(token, 0)])
+
+        ranked = []
+        for combination in itertools.product(*alternatives):
+            distance = sum(distance for _, distance in combination)
+            if distance == 0:
+                continue
+            replacements = iter(token for token, _ in combination)
+            suggestion = TOKEN_PATTERN.sub(lambda match: next(replacements), query_lower)
+            match_count = len(self.matching_rows(suggestion))
+            if match_count:
+                ranked.append((distance, -match_count, suggestion))
+
+        ranked.sort()
+        return [(suggestion, -negative_count) for _, negative_count, suggestion in ranked[:limit]]
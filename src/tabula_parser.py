@@ -5,16 +5,23 @@ IPL Sales Analyzer - Tabula Parser (100% Accurate Version)
 
 import os
 import sys
+import glob
+import time
+import threading
 import warnings
 import subprocess
 import tempfile
 import re
 import json
+from collections import OrderedDict
 import pandas as pd
 from datetime import datetime
 import numpy as np
 import logging
 
+from product_table import ProductTable
+import profiling
+
 # COMPLETELY SILENCE EVERYTHING
 warnings.filterwarnings("ignore")
 
@@ -29,44 +36,276 @@ os.environ['JAVA_OPTS'] = '-Djava.util.logging.config.file=/dev/null'
 os.environ['JAVA_TOOL_OPTIONS'] = '-Dorg.apache.commons.logging.Log=org.apache.commons.logging.impl.NoOpLog'
 
 # Create a context manager for complete silence - ENHANCED VERSION
+# Re-entrant and thread-safe: only the outermost entry redirects, the last exit restores
+# It silences the whole process (fds 1/2), so it is only used around the tabula
+# import and the JVM start - run start_jvm() before any worker threads use Tabula
 class CompleteSilence:
+    _lock = threading.Lock()
+    _depth = 0
+    _saved = None
+
     def __enter__(self):
-        self._original_stdout = sys.stdout
-        self._original_stderr = sys.stderr
-        self._devnull = open(os.devnull, 'w')
-        sys.stdout = self._devnull
-        sys.stderr = self._devnull
-        
-        # Also redirect the underlying file descriptors
-        self._saved_stdout_fd = os.dup(1)
-        self._saved_stderr_fd = os.dup(2)
-        self._devnull_fd = self._devnull.fileno()
-        os.dup2(self._devnull_fd, 1)
-        os.dup2(self._devnull_fd, 2)
-        
+        with CompleteSilence._lock:
+            if CompleteSilence._depth == 0:
+                devnull = open(os.devnull, 'w')
+                saved = (sys.stdout, sys.stderr, os.dup(1), os.dup(2), devnull)
+                sys.stdout = devnull
+                sys.stderr = devnull
+
+                # Also redirect the underlying file descriptors
+                os.dup2(devnull.fileno(), 1)
+                os.dup2(devnull.fileno(), 2)
+                CompleteSilence._saved = saved
+            CompleteSilence._depth += 1
+
         return self
-        
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore original stdout/stderr
-        os.dup2(self._saved_stdout_fd, 1)
-        os.dup2(self._saved_stderr_fd, 2)
-        sys.stdout = self._original_stdout
-        sys.stderr = self._original_stderr
-        self._devnull.close()
+        with CompleteSilence._lock:
+            CompleteSilence._depth -= 1
+            if CompleteSilence._depth == 0:
+                # Restore original stdout/stderr
+                original_stdout, original_stderr, saved_stdout_fd, saved_stderr_fd, devnull = CompleteSilence._saved
+                os.dup2(saved_stdout_fd, 1)
+                os.dup2(saved_stderr_fd, 2)
+                os.close(saved_stdout_fd)
+                os.close(saved_stderr_fd)
+                sys.stdout = original_stdout
+                sys.stderr = original_stderr
+                devnull.close()
+                CompleteSilence._saved = None
 
 # Import Tabula in complete silence
 with CompleteSilence():
     import tabula
 
-# REST OF YOUR CODE REMAINS THE SAME...
+# Bump whenever parsing changes so cached results are re-extracted
+PARSER_VERSION = "2"
+
+# Persistent extraction session - one JVM and one open document per PDF
+MAX_OPEN_DOCUMENTS = 4
+_JVM_START_LOCK = threading.Lock()
+
+def find_tabula_jar():
+    """Locate the tabula-java jar shipped with tabula-py"""
+    jar = os.environ.get('TABULA_JAR')
+    if jar and os.path.exists(jar):
+        return jar
+    jars = glob.glob(os.path.join(os.path.dirname(tabula.__file__), 'tabula-*-jar-with-dependencies.jar'))
+    return sorted(jars)[-1] if jars else None
+
+class TabulaSession:
+    """
+    Long-lived Tabula extraction session backed by JPype.
+    The JVM is started once and each PDF is loaded once, then header area,
+    table area and further files are all served from the same JVM.
+    Falls back to tabula.read_pdf when JPype cannot be used.
+    """
+
+    def __init__(self, max_open_documents=MAX_OPEN_DOCUMENTS):
+        self.max_open_documents = max_open_documents
+        self._documents = OrderedDict()
+        self._lock = threading.RLock()
+        self._java = None
+        self._jvm_failed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _ensure_jvm(self):
+        """Start (or attach to) the JVM and load the tabula classes once"""
+        if self._java is not None:
+            return True
+        if self._jvm_failed:
+            return False
+
+        try:
+            with _JVM_START_LOCK, profiling.stage('tabula.jvm_start'):
+                import jpype
+                if not jpype.isJVMStarted():
+                    jar = find_tabula_jar()
+                    if not jar:
+                        raise RuntimeError("tabula jar not found")
+                    jpype.addClassPath(jar)
+                    # The JVM writes straight to the process's stdout/stderr while starting
+                    with CompleteSilence():
+                        jpype.startJVM(
+                            "-Djava.awt.headless=true",
+                            "-Dorg.slf4j.simpleLogger.defaultLogLevel=off",
+                            "-Dorg.apache.commons.logging.Log=org.apache.commons.logging.impl.NoOpLog",
+                            convertStrings=False,
+                        )
+                self._java = {
+                    'File': jpype.JClass('java.io.File'),
+                    'PDDocument': jpype.JClass('org.apache.pdfbox.pdmodel.PDDocument'),
+                    'ObjectExtractor': jpype.JClass('technology.tabula.ObjectExtractor'),
+                    'BasicExtractionAlgorithm': jpype.JClass('technology.tabula.extractors.BasicExtractionAlgorithm'),
+                }
+            return True
+        except Exception:
+            self._jvm_failed = True
+            return False
+
+    def _open(self, pdf_path):
+        """Return (document, extractor) for a PDF, loading it only once"""
+        key = os.path.abspath(pdf_path)
+        if key in self._documents:
+            self._documents.move_to_end(key)
+            return self._documents[key]
+
+        # Java logging is switched off at JVM start, so no fd redirection is needed here
+        document = self._java['PDDocument'].load(self._java['File'](key))
+        extractor = self._java['ObjectExtractor'](document)
+        self._documents[key] = (document, extractor)
+
+        # Keep only a few documents loaded on low-memory phones
+        while len(self._documents) > self.max_open_documents:
+            _, (old_document, old_extractor) = self._documents.popitem(last=False)
+            self._close_document(old_document, old_extractor)
+
+        return document, extractor
+
+    def _close_document(self, document, extractor):
+        try:
+            extractor.close()
+        except Exception:
+            pass
+        try:
+            document.close()
+        except Exception:
+            pass
+
+    def page_count(self, pdf_path):
+        """Number of pages in the PDF"""
+        with self._lock:
+            if self._ensure_jvm():
+                document, _ = self._open(pdf_path)
+                return int(document.getNumberOfPages())
+        return None
+
+    def read_area(self, pdf_path, pages, area, progress=None):
+        """
+        Read tables from an area of the given pages (1-based page numbers).
+        Returns a list of DataFrames like tabula.read_pdf(..., pandas_options={'header': None})
+        progress, if given, is called once per page read
+        """
+        return [table for _, page_tables in self.iter_area(pdf_path, pages, area, progress)
+                for table in page_tables]
+
+    def iter_area(self, pdf_path, pages, area, progress=None):
+        """
+        Page-by-page form of read_area: yields (page_number, tables) as each page is read,
+        so the caller can parse a page before the next one is extracted.
+        Without JPype all pages come from one tabula.read_pdf call (page_number None).
+        The session lock is held per page, never across a yield.
+        """
+        pages = list(pages)
+
+        with self._lock:
+            use_jvm = self._ensure_jvm()
+            if not use_jvm:
+                tables = self._read_with_tabula(pdf_path, pages, area)
+        if not use_jvm:
+            if progress:
+                progress(len(pages))
+            yield None, tables
+            return
+
+        algorithm = self._java['BasicExtractionAlgorithm']()
+        top, left, bottom, right = [float(value) for value in area]
+
+        for page_number in pages:
+            with self._lock, profiling.stage('tabula.read_page'):
+                document, extractor = self._open(pdf_path)
+                if page_number < 1 or page_number > int(document.getNumberOfPages()):
+                    continue
+                page = extractor.extract(page_number)
+                page_area = page.getArea(top, left, bottom, right)
+                page_tables = [
+                    [[str(cell.getText()) for cell in row] for row in table.getRows()]
+                    for table in algorithm.extract(page_area)
+                ]
+            tables = [pd.DataFrame([[text if text else np.nan for text in row] for row in rows])
+                      for rows in page_tables if rows]
+            profiling.count('pages')
+            if progress:
+                progress(1)
+            yield page_number, tables
+
+    def _read_with_tabula(self, pdf_path, pages, area):
+        """Fallback: one tabula.read_pdf call for all requested pages (silent: tabula-java's stderr is dropped)"""
+        if not pages:
+            return []
+        return tabula.read_pdf(pdf_path, pages=pages, area=area, stream=True, silent=True,
+                               multiple_tables=True, pandas_options={'header': None})
+
+    def close(self):
+        """Close every open document; the JVM stays up for the process"""
+        with self._lock:
+            while self._documents:
+                _, (document, extractor) = self._documents.popitem(last=False)
+                self._close_document(document, extractor)
+
+_session = None
+
+def get_session():
+    """Shared extraction session for the whole run"""
+    global _session
+    if _session is None:
+        _session = TabulaSession()
+    return _session
+
+def start_jvm():
+    """
+    Start the JVM on the calling thread (no-op once started); call it before
+    handing work to threads, so the process-wide silencing of the JVM start
+    never hides output printed by other threads
+    """
+    session = get_session()
+    with session._lock:
+        return session._ensure_jvm()
+
+def close_session():
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+def parse_page_range(page_range, page_count=None):
+    """
+    Turn a page range ("339-345", (339, 345) or 339) into a list of 1-based pages.
+    None means every page of the document.
+    """
+    if page_range is None:
+        return list(range(1, page_count + 1)) if page_count else None
+
+    if isinstance(page_range, int):
+        start_page, end_page = page_range, page_range
+    elif isinstance(page_range, str):
+        parts = page_range.split('-')
+        start_page = int(parts[0].strip())
+        end_page = int(parts[-1].strip())
+    else:
+        start_page, end_page = page_range
+
+    if page_count:
+        end_page = min(end_page, page_count)
+
+    return list(range(start_page, end_page + 1))
+
 def extract_header_from_cut_pdf(cut_pdf_path):
     """
     Extract header information from CUT PDF - 100% Accurate Version
     """
     return extract_header_info(cut_pdf_path)
 
-def extract_header_info(pdf_path):
-    """Extract header information from the first page - 100% Accurate"""
+def extract_header_info(pdf_path, session=None, page=1, progress=None):
+    """Extract header information from the first page of a territory - 100% Accurate"""
+
+    session = session or get_session()
 
     header_info = {
         "pdf_file": os.path.basename(pdf_path),
@@ -81,8 +320,8 @@ def extract_header_info(pdf_path):
 
     try:
         header_area = [0, 0, 150, 600]
-        header_tables = tabula.read_pdf(pdf_path, pages=1, area=header_area,
-                                       stream=True, multiple_tables=True)
+        with profiling.stage('tabula.header'):
+            header_tables = session.read_area(pdf_path, [page], header_area, progress)
 
         raw_text = ""
         for table in header_tables:
@@ -109,35 +348,99 @@ def extract_header_info(pdf_path):
 
     return header_info
 
-def extract_table_data_fixed(pdf_path, page_range=None):
-    """Extract table data with proper column handling - 100% Accurate"""
-
-    print("Extracting table data with fixed column handling...")
-
-    all_rows = []
-
-    # Use provided page range or extract from all pages
-    pages = "all"
-
-    # Extract tables from specified pages
-    try:
-        tables = tabula.read_pdf(pdf_path, pages=pages, stream=True,
-                                area=[100, 0, 800, 600], multiple_tables=True,
-                                pandas_options={'header': None})
-
-        for table in tables:
-            if table is not None and len(table) > 0:
-                rows_from_table = process_table_fixed(table)
-                all_rows.extend(rows_from_table)
-
-    except Exception as e:
-        print(f"Table extraction error: {e}")
-
-    print(f"Processed {len(all_rows)} rows")
-    return create_final_dataframe(all_rows)
+TABLE_COLUMNS = ['Code', 'Brand_Name', 'Tgt_Qty', 'Sold_Qty', 'Int_Qty',
+                 'Tgt_Value', 'Sold_Value', 'Int_Value', 'Total_Value']
+HEADER_KEYWORDS_PATTERN = 'Code|Brand|Tgt|Sold|Int|Total|Group:'
+CODE_BRAND_PATTERN = r'^([A-Z0-9]{2,4})\s+(.*)'
+# Break-even of the vectorised parser: its ~10 ms of fixed pandas overhead
+# only pays off from about 150 rows (3-4 pages of 45-row tables)
+VECTORISE_MIN_ROWS = 150
+# A whole whitespace-separated token that is a number (same as re.match(r'^-?\d+\.?\d*$') per token)
+NUMBER_TOKEN_PATTERN = r'(?<!\S)-?\d+\.?\d*(?!\S)'
+
+def _join_columns(frame):
+    """Join the cells of every row with a space, column by column (no per-row Python)"""
+    columns = [frame[col] for col in frame.columns]
+    return columns[0].str.cat(columns[1:], sep=' ') if len(columns) > 1 else columns[0]
 
 def process_table_fixed(table):
-    """Process table with fixed column handling - 100% Accurate"""
+    """
+    Process table with fixed column handling - 100% Accurate
+    Vectorised: NaN-filling, header filtering, code/brand splitting and number
+    extraction run over whole columns. Returns a DataFrame with TABLE_COLUMNS,
+    row for row the same as process_table_rowwise.
+    """
+    if table is None or table.empty:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+
+    # NaN -> '', everything else str(cell).strip()
+    cells = table.astype(object).where(table.notna(), '')
+    cells.columns = range(cells.shape[1])
+    cells = cells.apply(lambda col: col.astype(str).str.strip())
+
+    filled = cells.ne('').to_numpy()
+    row_text = _join_columns(cells)
+
+    # Skip empty rows, header rows and rows with fewer than 3 non-empty cells
+    keep = (filled.sum(axis=1) >= 3) & ~row_text.str.contains(HEADER_KEYWORDS_PATTERN, regex=True).to_numpy()
+    if not keep.any():
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+
+    cells = cells[keep].reset_index(drop=True)
+    filled = filled[keep]
+    values = cells.to_numpy(dtype=object)
+
+    # The first non-empty cell holds code + brand; the cells after it hold the numbers
+    first_idx = filled.argmax(axis=1)
+    first_cell = pd.Series(values[np.arange(len(values)), first_idx], dtype=object)
+    code_brand = first_cell.str.extract(CODE_BRAND_PATTERN)
+
+    after_first = np.arange(values.shape[1]) > first_idx[:, None]
+    number_text = _join_columns(pd.DataFrame(np.where(after_first, values, ''), dtype=object))
+
+    tokens = number_text.str.findall(NUMBER_TOKEN_PATTERN)
+    counts = tokens.str.len().to_numpy()
+    parsed = pd.DataFrame(tokens.tolist(), dtype=object).reindex(columns=range(7)).fillna('0')
+    # float() per token via NumPy, so values are bit-identical to the row-wise parser
+    numbers = parsed.to_numpy(dtype=object).astype(float)
+
+    # SPECIAL FIX: a non-zero last number with 5 or 6 numbers is the shifted Total_Value
+    shifted6 = (counts == 6) & (numbers[:, 5] != 0)
+    shifted5 = (counts == 5) & (numbers[:, 4] != 0)
+    numbers[:, 6] = np.where(shifted6, numbers[:, 5], np.where(shifted5, numbers[:, 4], numbers[:, 6]))
+    numbers[shifted6 | shifted5, 5] = 0.0
+    numbers[shifted5, 4] = 0.0
+
+    result = pd.DataFrame(numbers, columns=TABLE_COLUMNS[2:])
+    result.insert(0, 'Brand_Name', code_brand[1].str.strip())
+    result.insert(0, 'Code', code_brand[0])
+    return result[code_brand[0].notna().to_numpy()].reset_index(drop=True)
+
+def process_tables_fixed(tables):
+    """
+    Process several tables (e.g. one per page) in a single vectorised pass.
+    Rows are independent, so the tables are stacked by column position;
+    narrower tables are padded with empty cells, which the parser ignores.
+    Below VECTORISE_MIN_ROWS input rows the row-wise parser is faster and is used instead.
+    """
+    tables = [table.set_axis(range(table.shape[1]), axis=1)
+              for table in tables if table is not None and len(table) > 0]
+    if not tables:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+    if sum(len(table) for table in tables) < VECTORISE_MIN_ROWS:
+        return _rows_to_frame([row for table in tables for row in process_table_rowwise(table)])
+    return process_table_fixed(pd.concat(tables, ignore_index=True))
+
+def _rows_to_frame(rows):
+    """process_table_rowwise rows as a DataFrame with the same dtypes as process_table_fixed"""
+    if not rows:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+    columns = list(zip(*rows))
+    return pd.DataFrame({name: pd.Series(values, dtype=object if i < 2 else float)
+                         for i, (name, values) in enumerate(zip(TABLE_COLUMNS, columns))})
+
+def process_table_rowwise(table):
+    """Reference row-by-row implementation of process_table_fixed (kept for benchmarks/cross-checks)"""
 
     rows = []
 
@@ -247,13 +550,11 @@ def parse_table_row_fixed(row_data):
 def create_final_dataframe(rows):
     """Create final DataFrame - 100% Accurate"""
 
-    if not rows:
+    if len(rows) == 0:
         return pd.DataFrame()
 
-    columns = ['Code', 'Brand_Name', 'Tgt_Qty', 'Sold_Qty', 'Int_Qty',
-               'Tgt_Value', 'Sold_Value', 'Int_Value', 'Total_Value']
-
-    df = pd.DataFrame(rows, columns=columns)
+    # rows: DataFrame from process_table_fixed, or list of rows from process_table_rowwise
+    df = rows.copy() if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=TABLE_COLUMNS)
 
     # Remove duplicates
     df = df.drop_duplicates(subset=['Code'], keep='first')
@@ -267,78 +568,142 @@ def create_final_dataframe(rows):
 
     return df
 
-def convert_to_existing_format(table_data, header_data):
-    """Convert Tabula output to existing application format"""
-    structured_data = []
-    zero_value_data = []
+# Streaming pipeline: page -> table -> row -> product
+# Each stage is a generator over the previous one, so only one batch of raw
+# tables and parsed rows is alive at a time.
+TABLE_AREA = [100, 0, 800, 600]
+# Pages per vectorised parsing pass: pandas costs ~10 ms per call, so a
+# territory range (usually 5-10 pages) is parsed in one pass; only longer
+# ranges (e.g. a whole report) are split, to bound memory
+STREAM_BATCH_PAGES = 32
+
+def iter_page_tables(pdf_path, page_range=None, session=None, progress=None):
+    """Page stage: yields the list of tables read from each page, one page at a time"""
+    session = session or get_session()
+    pages = parse_page_range(page_range, session.page_count(pdf_path))
+
+    if pages is None:
+        # No page count without the JVM: read the whole document in one call
+        tables = tabula.read_pdf(pdf_path, pages="all", stream=True, area=TABLE_AREA, silent=True,
+                                 multiple_tables=True, pandas_options={'header': None})
+        yield tables
+        return
+
+    for _, tables in session.iter_area(pdf_path, pages, TABLE_AREA, progress):
+        yield tables
+
+def iter_table_rows(page_tables, batch_pages=STREAM_BATCH_PAGES):
+    """
+    Table/row stage: parsed rows (a TABLE_COLUMNS DataFrame) per batch of
+    batch_pages pages, one process_tables_fixed pass per batch
+    """
+    batch, pages_in_batch = [], 0
+    for tables in page_tables:
+        batch.extend(tables)
+        pages_in_batch += 1
+        if pages_in_batch < batch_pages:
+            continue
+
+        rows = _parse_batch(batch)
+        batch, pages_in_batch = [], 0
+        if len(rows) > 0:
+            yield rows
 
-    if table_data.empty:
-        print("❌ Table data is empty - no products to convert")
-        return structured_data, zero_value_data
-
-    for _, row in table_data.iterrows():
-        product_entry = {
-            'code': str(row['Code']),
-            'brand_name': str(row['Brand_Name']),
-            'tgt_qty': int(row['Tgt_Qty']),
-            'sold_qty': int(row['Sold_Qty']),
-            'int_qty': int(row['Int_Qty']),
-            'tgt_val': float(row['Tgt_Value']),
-            'sold_val': float(row['Sold_Value']),
-            'int_val': float(row['Int_Value']),
-            'total_val': float(row['Total_Value']),
-            'territory': header_data.get('territory_id', 'Unknown')
-        }
-
-        # Check if product has any activity
-        has_activity = (
-            product_entry['sold_qty'] > 0 or
-            product_entry['int_qty'] > 0 or
-            product_entry['sold_val'] > 0 or
-            product_entry['int_val'] > 0 or
-            product_entry['total_val'] > 0
-        )
-
-        if has_activity:
-            structured_data.append(product_entry)
-        else:
-            zero_value_data.append(product_entry)
-
-    print(f"✅ Converted {len(structured_data)} active products and {len(zero_value_data)} zero-value products")
-    return structured_data, zero_value_data
+    if batch:
+        rows = _parse_batch(batch)
+        if len(rows) > 0:
+            yield rows
+
+def _parse_batch(tables):
+    with profiling.stage('parse.rows'):
+        rows = process_tables_fixed(tables)
+    profiling.count('rows', len(rows))
+    return rows
+
+def iter_products(row_frames, territory='Unknown'):
+    """
+    Product stage: a ProductTable per batch of parsed rows.
+    A code seen on an earlier page is dropped, so the stream holds the same
+    products as create_final_dataframe on the whole range (first occurrence wins).
+    """
+    seen_codes = set()
+    for rows in row_frames:
+        with profiling.stage('convert.products'):
+            rows = create_final_dataframe(rows[~rows['Code'].isin(seen_codes)])
+            if rows.empty:
+                continue
+            seen_codes.update(rows['Code'])
+            products = ProductTable.from_dataframe(rows, territory)
+        profiling.count('products', len(products))
+        yield products
+
+def stream_pdf_data_tabula(pdf_path, page_range=None, session=None, progress=None):
+    """
+    Streaming form of extract_pdf_data_tabula
+    Reads the header, then returns (header_data, products) where products is a
+    generator of ProductTables, one per STREAM_BATCH_PAGES pages, so a long
+    range never holds more than one batch of raw tables in memory.
+    """
+    session = session or get_session()
+
+    pages = parse_page_range(page_range)
+    first_page = pages[0] if pages else 1
+
+    # Extract header from the first page of the range
+    header_data = extract_header_info(pdf_path, session, first_page, progress)
+
+    page_tables = iter_page_tables(pdf_path, page_range, session, progress)
+    products = iter_products(iter_table_rows(page_tables), header_data.get('territory_id', 'Unknown'))
+    return header_data, products
 
 # MAIN FUNCTION - CALL THIS FROM ipl_analyzer.py
-def extract_pdf_data_tabula(cut_pdf_path, page_range=None):
+def extract_pdf_data_tabula(pdf_path, page_range=None, session=None, progress=None):
     """
-    Extract data from CUT PDF (small extracted file)
+    Extract data for a page range straight from the original report PDF
     This is the MAIN function called from ipl_analyzer.py
     - 100% Accurate Version
+    Header and table areas are read from one document in one JVM session;
+    a territory range is parsed in one pass (longer ranges in batches)
+    progress, if given, is called once per page read (header page included)
     """
-    print(f"🔍 Starting 100% Accurate Tabula extraction from: {os.path.basename(cut_pdf_path)}")
+    print(f"🔍 Starting 100% Accurate Tabula extraction from: {os.path.basename(pdf_path)}")
+
+    start_time = time.time()
 
-    # Extract header from the CUT PDF
-    header_data = extract_header_info(cut_pdf_path)
+    header_data, product_pages = stream_pdf_data_tabula(pdf_path, page_range, session, progress)
+
+    print("Extracting table data with fixed column handling...")
+    page_products = []
+    try:
+        for products in product_pages:
+            page_products.append(products)
+    except Exception as e:
+        print(f"Table extraction error: {e}")
+        page_products = []
 
-    # Extract table data from the CUT PDF
-    table_data = extract_table_data_fixed(cut_pdf_path, page_range)
+    products = ProductTable.concat(page_products)
+    print(f"Processed {len(products)} products")
+    if len(products) == 0:
+        print("❌ Table data is empty - no products to convert")
 
-    # Convert to existing format
-    structured_data, zero_value_data = convert_to_existing_format(table_data, header_data)
+    # Split on the precomputed activity mask
+    structured_data, zero_value_data = products.split_by_activity()
 
     print(f"🎯 Extraction Complete: {len(structured_data)} active products, {len(zero_value_data)} zero-value products")
     print(f"📍 Territory: {header_data.get('territory_id', 'Unknown')}")
     print(f"📅 Period: {header_data.get('period_from', 'Unknown')} to {header_data.get('period_to', 'Unknown')}")
+    print(f"⏱️  Extraction time: {time.time() - start_time:.2f}s")
 
     return structured_data, zero_value_data, header_data
 
 # Test function
 def test_tabula_parser():
     """Test the 100% accurate Tabula parser"""
-    pdf_path = "/storage/emulated/0/SalesSource/temp_extracted_pages_339_to_345.pdf"
+    pdf_path = "/storage/emulated/0/SalesSource/mpo_sale_qty_value_SPECIAL_t.PDF"
     if os.path.exists(pdf_path):
         print("🧪 Testing 100% Accurate Tabula parser...")
 
-        structured_data, zero_value_data, header_data = extract_pdf_data_tabula(pdf_path, "1-5")
+        structured_data, zero_value_data, header_data = extract_pdf_data_tabula(pdf_path, "339-345")
         print(f"✅ Extracted {len(structured_data)} products with activity")
         print(f"✅ Extracted {len(zero_value_data)} products with zero activity")
         print(f"✅ Territory: {header_data.get('territory_id')}")
@@ -350,7 +715,7 @@ def test_tabula_parser():
                 print(f"   {i+1}. {product['code']} - {product['brand_name']} - Tk {product['total_val']:.2f}")
 
     else:
-        print("❌ Cut PDF not found - run main analyzer first")
+        print("❌ Sales PDF not found in SalesSource")
 
 if __name__ == "__main__":
     test_tabula_parser()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Territory Index
+Maps every territory in a report to its page range with one pdftotext pass
+"""
+
+import re
+import shutil
+import subprocess
+
+import core_pure_python as core
+
+GROUP_PATTERN = re.compile(r'Group:\s*([A-Z\-]+)')
+READ_CHUNK_SIZE = 64 * 1024
+
+def iter_pdf_pages_text(pdf_path, first_page=None, last_page=None, layout=True):
+    """
+    Stream the text of each page from pdftotext, one page at a time.
+    Yields (page_number, text); pages are split on the form feed pdftotext emits.
+    """
+    cmd = ['pdftotext']
+    if layout:
+        cmd.append('-layout')
+    if first_page:
+        cmd += ['-f', str(first_page)]
+    if last_page:
+        cmd += ['-l', str(last_page)]
+    cmd += [pdf_path, '-']
+
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    page_number = first_page or 1
+    pending = b''
+    try:
+        while True:
+            chunk = process.stdout.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            *pages, pending = pending.split(b'\f')
+            for page in pages:
+                yield page_number, page.decode('utf-8', errors='ignore')
+                page_number += 1
+        if pending.strip():
+            yield page_number, pending.decode('utf-8', errors='ignore')
+    finally:
+        process.stdout.close()
+        process.wait()
+
+def build_territory_index(pdf_path, progress=None):
+    """
+    Walk the whole report once and return one entry per territory:
+    {'territory', 'first_page', 'last_page', 'group', 'period'}.
+    Pages without a 'Terr Id:' header continue the previous territory.
+    """
+    entries = {}
+    current = None
+
+    for page_number, text in iter_pdf_pages_text(pdf_path):
+        territories = core.extract_territory_ids_python(text)
+        if territories:
+            territory_id = territories[0]
+            if territory_id not in entries:
+                group_match = GROUP_PATTERN.search(text)
+                period = core.extract_date_range_python(text)
+                entries[territory_id] = {
+                    'territory': territory_id,
+                    'first_page': page_number,
+                    'last_page': page_number,
+                    'group': group_match.group(1) if group_match else 'Unknown',
+                    'period': period,
+                }
+            current = entries[territory_id]
+
+        if current:
+            current['last_page'] = max(current['last_page'], page_number)
+
+        if progress:
+            progress(1)
+
+    return sorted(entries.values(), key=lambda entry: entry['first_page'])
+
+def is_available():
+    """The index needs poppler's pdftotext"""
+    return shutil.which('pdftotext') is not None
+
+def get_territory_index(pdf_path, file_hash, registry, progress=None):
+    """
+    Territory index for a report: read from the registry, or built once and stored.
+    Returns [] when it can't be built (no pdftotext, or no 'Terr Id:' found).
+    """
+    entries = registry.get_territory_index(file_hash)
+    if entries or not file_hash or not is_available():
+        return entries
+
+    try:
+        entries = build_territory_index(pdf_path, progress)
+    except Exception:
+        return []
+
+    if entries:
+        registry.save_territory_index(file_hash, entries)
+    return entries
+
+def find_territory(entries, territory_query):
+    """Entry whose territory id matches the query (case-insensitive), or None"""
+    query = territory_query.strip().upper()
+    for entry in entries:
+        if entry['territory'].upper() == query:
+            return entry
+    return None
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+IPL Sales Analyzer - Text Engine
+Extracts a page range from the PDF text layer (pdftotext -layout) with the
+pure-Python line parser, without starting the JVM
+"""
+
+import os
+import re
+from datetime import datetime
+
+import core_pure_python as core
+import territory_index
+from product_table import ProductTable
+
+# Part of the cache key, so text-engine results never mix with Tabula's
+TEXT_ENGINE_VERSION = "1"
+
+CODE_PATTERN = re.compile(r'[A-Z0-9]{2,4}')
+PERIOD_PATTERN = re.compile(r'From\s*:\s*(\d{2}-[A-Z]{3}-\d{2})\s*To\s*(\d{2}-[A-Z]{3}-\d{2})')
+PRINTED_PATTERN = re.compile(r'Printed On:\s*([\d\-A-Z:\s]+(?:AM|PM))')
+GROUP_PATTERN = re.compile(r'Group:\s*([A-Z\-]+)')
+
+# Cross-check against Tabula: pages sampled and allowed difference per value
+SAMPLE_PAGES = 2
+VALUE_TOLERANCE = 0.01
+
+def is_available():
+    """The text engine needs poppler's pdftotext"""
+    return territory_index.is_available()
+
+def page_bounds(page_range):
+    """(first, last) from 'a-b', (a, b) or a single page number"""
+    if isinstance(page_range, str):
+        first, _, last = page_range.partition('-')
+        return int(first), int(last or first)
+    if isinstance(page_range, int):
+        return page_range, page_range
+    return int(page_range[0]), int(page_range[1])
+
+def parse_header_text(text, pdf_path):
+    """Header fields from the text of a territory's first page (same keys as the Tabula header)"""
+    header_info = {
+        "pdf_file": os.path.basename(pdf_path),
+        "extraction_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "report_type": "Territory Wise Sale",
+        "period_from": "Unknown",
+        "period_to": "Unknown",
+        "printed_on": "Unknown",
+        "group": "Unknown",
+        "territory_id": "Unknown_Territory",
+    }
+
+    period_match = PERIOD_PATTERN.search(text)
+    if period_match:
+        header_info["period_from"], header_info["period_to"] = period_match.groups()
+
+    printed_match = PRINTED_PATTERN.search(text)
+    if printed_match:
+        header_info["printed_on"] = printed_match.group(1).strip()
+
+    group_match = GROUP_PATTERN.search(text)
+    if group_match:
+        header_info["group"] = group_match.group(1)
+
+    territories = core.extract_territory_ids_python(text)
+    if territories:
+        header_info["territory_id"] = territories[0]
+
+    return header_info
+
+def iter_products(pages):
+    """ProductLine records from (page_number, text) pages, one classify_product_line call per line"""
+    classify = core.classify_product_line
+    for _, text in pages:
+        for line in text.splitlines():
+            product = classify(line)
+            if product and CODE_PATTERN.fullmatch(product.code):
+                yield product
+
+def extract_pdf_data_text(pdf_path, page_range, progress=None):
+    """
+    Text-layer equivalent of tabula_parser.extract_pdf_data_tabula
+    Returns (structured_data, zero_value_data, header_data); the product lists are ProductTables
+    progress, if given, is called once for the header and once per page
+    """
+    first_page, last_page = page_bounds(page_range)
+    header_data = None
+    products = {}
+
+    def pages():
+        nonlocal header_data
+        for page_number, text in territory_index.iter_pdf_pages_text(pdf_path, first_page, last_page):
+            if header_data is None:
+                header_data = parse_header_text(text, pdf_path)
+                if progress:
+                    progress(1)
+            yield page_number, text
+            if progress:
+                progress(1)
+
+    # Duplicate codes keep the first occurrence, like create_final_dataframe
+    for product in iter_products(pages()):
+        products.setdefault(product.code, product)
+
+    header_data = header_data or parse_header_text("", pdf_path)
+    territory = header_data.get('territory_id', 'Unknown')
+    product_dicts = []
+    for product in products.values():
+        product = product.as_dict()
+        product['territory'] = territory
+        product_dicts.append(product)
+
+    return (*ProductTable.from_dicts(product_dicts).split_by_activity(), header_data)
+
+def sample_range(start_page, end_page):
+    """Pages of a range used to cross-check the engines on that range"""
+    return start_page, min(end_page, start_page + SAMPLE_PAGES - 1)
+
+def compare_results(text_result, tabula_result):
+    """
+    Compare the products two engines found on the same pages.
+    Returns (verdict, detail): 'match', 'mismatch' or 'inconclusive' (no products on the sample)
+    """
+    text_products = {product['code']: product for product in list(text_result[0]) + list(text_result[1])}
+    tabula_products = {product['code']: product for product in list(tabula_result[0]) + list(tabula_result[1])}
+
+    if not text_products and not tabula_products:
+        return 'inconclusive', "no products on the sample pages"
+    if text_products.keys() != tabula_products.keys():
+        missing = len(tabula_products.keys() - text_products.keys())
+        extra = len(text_products.keys() - tabula_products.keys())
+        return 'mismatch', f"{missing} product(s) missing, {extra} extra"
+
+    for code, expected in tabula_products.items():
+        actual = text_products[code]
+        for field in ('tgt_qty', 'sold_qty', 'int_qty', 'tgt_val', 'sold_val', 'int_val', 'total_val'):
+            if abs(actual[field] - expected[field]) > VALUE_TOLERANCE:
+                return 'mismatch', f"{code} {field}: {actual[field]} vs {expected[field]}"
+
+    return 'match', f"{len(tabula_products)} products identical"